@@ -1,6 +1,7 @@
-import sys
 import os
-import random
+import sys
+import hashlib
+import logging
 from pathlib import Path
 
 # 确保当前目录在Python路径中
@@ -8,23 +9,49 @@ current_dir = Path(__file__).parent.absolute()
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from fastapi import FastAPI, HTTPException, Header, Depends, Request
+from fastapi import FastAPI, HTTPException, Header, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from typing import Optional
+from functools import lru_cache
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import time
-from rank_calculator import calculate_enhanced_rank, get_detailed_analysis
-from data import get_year_stats, get_score_distribution
+import anyio
+import orjson
+from rank_calculator import calculate_enhanced_rank, get_detailed_analysis, get_rank_calculator
+from data import get_year_summary
 from school_recommender import recommend_schools_by_rank
-from api_auth import verify_api_key_with_delay, blur_rank_data, blur_score_data, should_blur_data, API_KEY_INFO
+from api_auth import verify_api_key_with_delay, API_KEY_INFO
 from request_logger import request_logger
+from middleware import RequestContextMiddleware
+
+logger = logging.getLogger(__name__)
+
+# 位次查询和统计使用的数据年份
+QUERY_YEAR = 2025
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """启动时加载数据并预计算排名表和统计响应、预读静态文件，避免首个请求承担构建开销"""
+    get_rank_calculator(QUERY_YEAR)
+    _stats_payload(QUERY_YEAR)
+    if static_files is not None:
+        await anyio.to_thread.run_sync(static_files.preload)
+    yield
 
 app = FastAPI(
     title="天津中考位次查询API",
-    description="查询2025年天津市六区中考成绩位次",
-    version="1.0.0"
+    description=f"查询{QUERY_YEAR}年天津市六区中考成绩位次",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # 使用orjson序列化响应
+    lifespan=lifespan
 )
 
 # 配置CORS
@@ -35,15 +62,138 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestContextMiddleware)
+
+# 静态资源缓存策略（资源URL未带版本号，不能使用 immutable 长缓存）
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+STATIC_CACHE_MAX_ENTRIES = 64      # 内存中最多缓存的静态文件数
+STATIC_REVALIDATE_SECONDS = 5.0    # 按 mtime/size 复查文件是否变更的间隔
+
+@dataclass
+class _StaticCacheEntry:
+    """静态文件内存缓存条目"""
+    full_path: str
+    content: bytes
+    headers: dict
+    file_signature: tuple  # (mtime, size)
+    checked_at: float
+
+class CachedStaticFiles(StaticFiles):
+    """带内存LRU缓存的静态文件服务
+
+    文件首次请求时读入内存，之后直接从内存返回，每隔
+    STATIC_REVALIDATE_SECONDS 秒复查一次文件是否变更。
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache: "OrderedDict[str, _StaticCacheEntry]" = OrderedDict()
+    
+    async def get_response(self, path: str, scope) -> Response:
+        entry = self._cache.get(path)
+        if entry is not None and scope["method"] in ("GET", "HEAD"):
+            if time.monotonic() - entry.checked_at >= STATIC_REVALIDATE_SECONDS:
+                signature = await anyio.to_thread.run_sync(self._file_signature, entry.full_path)
+                if signature == entry.file_signature:
+                    entry.checked_at = time.monotonic()
+                else:
+                    del self._cache[path]
+                    entry = None
+            if entry is not None:
+                self._cache.move_to_end(path)
+                return self._cached_response(entry, scope)
+        
+        response = await super().get_response(path, scope)
+        if isinstance(response, FileResponse) and response.status_code == 200:
+            entry = await anyio.to_thread.run_sync(self._load_entry, response)
+            self._cache[path] = entry
+            while len(self._cache) > STATIC_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+            return self._cached_response(entry, scope)
+        return response
+    
+    def preload(self) -> int:
+        """启动时把目录下的文件全部读入缓存，首个请求无需访问磁盘，返回缓存的文件数"""
+        loaded = 0
+        for root, _dirs, files in os.walk(self.directory):
+            for name in sorted(files):
+                if len(self._cache) >= STATIC_CACHE_MAX_ENTRIES:
+                    return loaded
+                full_path = os.path.join(root, name)
+                try:
+                    stat_result = os.stat(full_path)
+                except OSError:
+                    continue
+                # 与 StaticFiles.get_path 的结果一致，保证请求时能命中缓存
+                path = os.path.relpath(full_path, self.directory)
+                response = self.file_response(full_path, stat_result, {"type": "http", "headers": []})
+                self._cache[path] = self._load_entry(response)
+                loaded += 1
+        return loaded
+    
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+        return response
+    
+    @staticmethod
+    def _file_signature(full_path: str) -> Optional[tuple]:
+        try:
+            stat_result = os.stat(full_path)
+        except OSError:
+            return None
+        return (stat_result.st_mtime, stat_result.st_size)
+    
+    @staticmethod
+    def _load_entry(response: FileResponse) -> _StaticCacheEntry:
+        with open(response.path, 'rb') as f:
+            content = f.read()
+        headers = {
+            name: response.headers[name]
+            for name in ("content-type", "etag", "last-modified", "cache-control")
+            if name in response.headers
+        }
+        stat_result = response.stat_result
+        return _StaticCacheEntry(
+            full_path=str(response.path),
+            content=content,
+            headers=headers,
+            file_signature=(stat_result.st_mtime, stat_result.st_size),
+            checked_at=time.monotonic()
+        )
+    
+    def _cached_response(self, entry: _StaticCacheEntry, scope) -> Response:
+        response_headers = Headers(headers=entry.headers)
+        if self.is_not_modified(response_headers, Headers(scope=scope)):
+            return NotModifiedResponse(response_headers)
+        if scope["method"] == "HEAD":
+            return Response(headers={**entry.headers, "content-length": str(len(entry.content))})
+        return Response(content=entry.content, headers=entry.headers)
+
+# 前端文件路径（模块加载时解析一次）
+FRONTEND_PATH = current_dir.parent / "frontend"
+STATIC_PATH = FRONTEND_PATH / "static"
+INDEX_HTML_FILE = FRONTEND_PATH / "index.html"
+RECOMMEND_HTML_FILE = FRONTEND_PATH / "recommend.html"
+STATS_HTML_FILE = FRONTEND_PATH / "stats.html"
 
 # 挂载静态文件
-STATIC_PATH = Path(__file__).parent.parent / "frontend" / "static"
+static_files: Optional[CachedStaticFiles] = None
 if STATIC_PATH.exists():
-    app.mount("/static", StaticFiles(directory=str(STATIC_PATH)), name="static")
+    static_files = CachedStaticFiles(directory=str(STATIC_PATH))
+    app.mount("/static", static_files, name="static")
 
 # 数据模型
 class ScoreQuery(BaseModel):
     score: float = Field(..., ge=0, le=800, description="中考分数（0-800）")
+    
+    @field_validator("score")
+    @classmethod
+    def check_precision(cls, v: float) -> float:
+        """验证分数精度（支持0.01分）：换算为整数0.01分后必须能还原为原值"""
+        if round(v * 100) / 100 != v:
+            raise ValueError("分数仅支持保留两位小数（如750.25、750.50）")
+        return v
 
 class RankResponse(BaseModel):
     score: float
@@ -61,17 +211,52 @@ class RankResponse(BaseModel):
 
 # 这些函数已经从 rank_calculator 模块导入，不再需要在这里定义
 
-# 获取前端文件路径
-FRONTEND_PATH = Path(__file__).parent.parent / "frontend"
+def _read_page(html_file: Path) -> Optional[bytes]:
+    """读取前端页面的UTF-8字节，文件不存在时返回None"""
+    try:
+        return html_file.read_bytes()
+    except FileNotFoundError:
+        logger.warning("前端页面文件不存在: %s", html_file)
+        return None
+
+# 前端页面在启动时读取一次（保存UTF-8字节，响应时无需再编码），后续请求直接返回内存中的内容
+INDEX_HTML = _read_page(INDEX_HTML_FILE)
+RECOMMEND_HTML = _read_page(RECOMMEND_HTML_FILE)
+STATS_HTML = _read_page(STATS_HTML_FILE)
+def _make_etag(content: bytes) -> str:
+    """根据响应内容生成强ETag"""
+    return f'"{hashlib.sha1(content).hexdigest()}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """判断请求的If-None-Match是否命中给定ETag
+
+    按 RFC 9110 对 If-None-Match 使用弱比较：忽略 W/ 前缀，"*" 匹配任意ETag
+    （与 starlette StaticFiles.is_not_modified 一致）
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+INDEX_ETAG = _make_etag(INDEX_HTML) if INDEX_HTML is not None else None
+HTML_CACHE_CONTROL = "public, max-age=300"
+# 进程生命周期内不变的JSON数据（统计、API信息）的缓存策略
+JSON_CACHE_CONTROL = "public, max-age=3600"
+
+def _index_response(request: Request) -> Response:
+    """返回查询界面，客户端缓存的ETag未变化时返回304"""
+    if _etag_matches(request, INDEX_ETAG):
+        return Response(status_code=304, headers={"ETag": INDEX_ETAG, "Cache-Control": HTML_CACHE_CONTROL})
+    return HTMLResponse(content=INDEX_HTML, headers={"ETag": INDEX_ETAG, "Cache-Control": HTML_CACHE_CONTROL})
 
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def welcome():
+async def welcome(request: Request):
     """显示欢迎页面，直接重定向到查询界面"""
     # 直接返回查询界面
-    html_file = FRONTEND_PATH / "index.html"
-    if html_file.exists():
-        with open(html_file, 'r', encoding='utf-8') as f:
-            return HTMLResponse(content=f.read())
+    if INDEX_HTML is not None:
+        return _index_response(request)
     else:
         return HTMLResponse(content="<h1>欢迎使用天津中考位次查询API</h1><p>请访问 <a href='/app'>查询界面</a> 或 <a href='/docs'>API文档</a></p>")
 
@@ -79,17 +264,11 @@ async def welcome():
          summary="查询界面",
          description="天津中考位次查询Web界面",
          tags=["前端页面"])
-async def serve_app():
+async def serve_app(request: Request):
     """提供查询界面（会在API文档中显示）"""
-    html_file = FRONTEND_PATH / "index.html"
-    if html_file.exists():
-        # 读取HTML文件并修改API地址
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
+    if INDEX_HTML is not None:
         # 不修改API地址，保持原样
-        
-        return HTMLResponse(content=html_content)
+        return _index_response(request)
     else:
         raise HTTPException(status_code=404, detail="前端文件未找到")
 
@@ -99,13 +278,9 @@ async def serve_app():
          tags=["前端页面"])
 async def serve_recommend_app():
     """提供志愿推荐界面"""
-    html_file = FRONTEND_PATH / "recommend.html"
-    if html_file.exists():
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content)
-    else:
+    if RECOMMEND_HTML is None:
         raise HTTPException(status_code=404, detail="推荐页面文件未找到")
+    return HTMLResponse(content=RECOMMEND_HTML)
 
 @app.get("/admin/stats", 
          summary="统计页面",
@@ -113,53 +288,98 @@ async def serve_recommend_app():
          tags=["管理页面"])
 async def serve_stats_page():
     """提供统计页面"""
-    html_file = FRONTEND_PATH / "stats.html"
-    if html_file.exists():
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content)
-    else:
+    if STATS_HTML is None:
         raise HTTPException(status_code=404, detail="统计页面文件未找到")
+    return HTMLResponse(content=STATS_HTML)
 
 @app.get("/api/stats",
          summary="获取统计数据",
          description="获取API请求统计和日志数据",
          tags=["API"])
-async def get_request_stats():
+def get_request_stats():
     """获取请求统计数据"""
     try:
         stats = request_logger.get_stats()
-        return JSONResponse(content=stats)
+        return ORJSONResponse(content=stats)
     except Exception as e:
-        print(f"获取统计数据失败: {str(e)}")
+        logger.exception("获取统计数据失败")
         raise HTTPException(
             status_code=500,
             detail=f"获取统计数据失败：{str(e)}"
         )
 
+def _cached_json_response(request: Request, payload: bytes, etag: str) -> Response:
+    """返回预先序列化的JSON，客户端缓存的ETag未变化时返回304"""
+    headers = {"ETag": etag, "Cache-Control": JSON_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+# API信息为静态内容，启动时序列化一次
+API_INFO_PAYLOAD = orjson.dumps({
+    "message": "天津中考位次查询API",
+    "version": "1.0.0",
+    "endpoints": {
+        "/": "查询界面",
+        "/rank": "查询位次API",
+        "/recommend": "志愿推荐API",
+        "/stats": "统计信息API",
+        "/docs": "API文档",
+        "/redoc": "API文档(ReDoc)"
+    },
+    "api_key_required": True,
+    "api_key_info": API_KEY_INFO
+})
+API_INFO_ETAG = _make_etag(API_INFO_PAYLOAD)
+
 @app.get("/api-info")
-async def api_info():
+async def api_info(request: Request):
     """API信息（原来的根路由）"""
-    return {
-        "message": "天津中考位次查询API",
-        "version": "1.0.0",
-        "endpoints": {
-            "/": "查询界面",
-            "/rank": "查询位次API",
-            "/recommend": "志愿推荐API",
-            "/stats": "统计信息API",
-            "/docs": "API文档",
-            "/redoc": "API文档(ReDoc)"
-        },
-        "api_key_required": True,
-        "api_key_info": API_KEY_INFO
-    }
-
-@app.post("/rank", response_model=RankResponse)
+    return _cached_json_response(request, API_INFO_PAYLOAD, API_INFO_ETAG)
+
+@dataclass
+class ApiKeyCheck:
+    """API密钥验证结果（由 require_api_key 依赖提供）"""
+    api_key: Optional[str]
+    is_valid: bool
+    error: Optional[HTTPException] = None
+
+async def require_api_key(api_key: Optional[str] = Header(None, alias="X-API-Key")) -> ApiKeyCheck:
+    """验证API密钥；验证失败时返回错误而不直接抛出，由处理函数记录日志后抛出"""
+    try:
+        return ApiKeyCheck(api_key, await verify_api_key_with_delay(api_key))
+    except HTTPException as e:
+        return ApiKeyCheck(api_key, False, e)
+    except Exception as e:
+        logger.warning("密钥验证异常: %s", e)
+        return ApiKeyCheck(api_key, False)
+
+async def parse_score_query(request: Request) -> ScoreQuery:
+    """直接从原始请求体解析并校验 ScoreQuery（JSON解析与校验在pydantic-core中一次完成）"""
+    body = await request.body()
+    try:
+        return ScoreQuery.model_validate_json(body)
+    except ValidationError as e:
+        # 与FastAPI默认的请求体校验错误格式保持一致
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=body
+        )
+
+@app.post(
+    "/rank",
+    response_model=None,
+    responses={200: {"model": RankResponse}},
+    # 请求体由 parse_score_query 手动解析，需单独声明文档中的请求体结构
+    openapi_extra={"requestBody": {
+        "content": {"application/json": {"schema": ScoreQuery.model_json_schema()}},
+        "required": True
+    }}
+)
 async def query_rank(
     request: Request,
-    query: ScoreQuery,
-    api_key: Optional[str] = Header(None, alias="X-API-Key")
+    query: ScoreQuery = Depends(parse_score_query),
+    auth: ApiKeyCheck = Depends(require_api_key)
 ):
     """
     查询2025年天津市六区中考成绩位次
@@ -167,65 +387,37 @@ async def query_rank(
     - **score**: 中考分数（0-800分，支持0.1分精度）
     - **X-API-Key**: API密钥（通过请求头传递）
     """
-    start_time = time.time()
-    print(f"🔍 [DEBUG] 收到查询请求: score={query.score}")
-    
-    # 获取客户端信息
-    client_ip = request.client.host if request.client else "unknown"
-    user_agent = request.headers.get("user-agent", "unknown")
-    
-    # 验证API密钥
+    # 请求开始时间和客户端信息由 RequestContextMiddleware 记录
+    start_time = request.state.start_time
+    client_ip = request.state.client_ip
+    user_agent = request.state.user_agent
+    api_key = auth.api_key
+    is_valid = auth.is_valid
     status_code = 200
-    error_msg = None
     
-    try:
-        is_valid = await verify_api_key_with_delay(api_key)
-    except HTTPException as e:
-        status_code = e.status_code
-        error_msg = e.detail
-        # 记录请求日志
+    # 密钥验证失败（已在依赖中完成延迟），记录请求日志后返回错误
+    if auth.error is not None:
         request_logger.log_request(
             endpoint="/rank",
             api_key=api_key,
             is_valid_key=False,
-            status_code=status_code,
-            response_time=time.time() - start_time,
+            status_code=auth.error.status_code,
+            response_time=time.perf_counter() - start_time,
             client_ip=client_ip,
             user_agent=user_agent,
             request_data={"score": query.score},
-            error=error_msg
+            error=auth.error.detail
         )
-        raise
-    except Exception as e:
-        print(f"❌ [AUTH] 密钥验证异常: {str(e)}")
-        is_valid = False
-    print(f"🔍 [DEBUG] 当前工作目录: {os.getcwd()}")
-    print(f"🔍 [DEBUG] 目录内容: {os.listdir('.')}")
-    
-    # 检查数据库文件存在性
-    db_paths_to_check = ['scores.db', '/app/backend/scores.db', './scores.db']
-    for db_path in db_paths_to_check:
-        exists = os.path.exists(db_path)
-        print(f"🔍 [DEBUG] 数据库路径 {db_path}: {'存在' if exists else '不存在'}")
-        if exists:
-            print(f"🔍 [DEBUG] 文件大小: {os.path.getsize(db_path)} bytes")
+        raise auth.error
     
     try:
-        # 验证分数精度（支持0.01分，修复浮点数精度问题）
-        score_str = str(query.score)
-        decimal_index = score_str.find('.')
-        if decimal_index != -1 and len(score_str) - decimal_index - 1 > 2:
-            raise HTTPException(
-                status_code=400,
-                detail="分数仅支持保留两位小数（如750.25、750.50）"
-            )
-        
-        print(f"🔍 [DEBUG] 开始调用 calculate_enhanced_rank...")
-        
-        # 使用增强版的计算函数
-        rank_result = calculate_enhanced_rank(query.score, year=2025)
+        # 分数精度已在 ScoreQuery 解析时验证
+        # 使用增强版的计算函数（分数精确到0.01分，结果在 rank_calculator 中缓存）
+        rank_result = calculate_enhanced_rank(query.score, year=QUERY_YEAR)
+        analysis = get_detailed_analysis(rank_result)
         
-        print(f"🔍 [DEBUG] 计算结果: {rank_result}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("score=%s 计算结果: %s", query.score, rank_result)
         
         if rank_result['total_students'] == 0:
             raise HTTPException(
@@ -233,11 +425,6 @@ async def query_rank(
                 detail="无法获取数据，请稍后重试"
             )
         
-        # 生成详细分析
-        analysis = get_detailed_analysis(rank_result)
-        
-        print(f"🔍 [DEBUG] 分析完成，准备返回结果")
-        
         # 无论是否有有效密钥，都返回真实数据
         # （延迟和错误已经在 verify_api_key_with_delay 中处理）
         # 记录请求日志
@@ -246,38 +433,36 @@ async def query_rank(
             api_key=api_key,
             is_valid_key=is_valid,
             status_code=status_code,
-            response_time=time.time() - start_time,
+            response_time=time.perf_counter() - start_time,
             client_ip=client_ip,
             user_agent=user_agent,
             request_data={"score": query.score}
         )
         
-        return RankResponse(
-            score=query.score,
-            rank=rank_result['rank'],
-            inner_rank=rank_result['inner_rank'],
-            rank_range=rank_result['rank_range'],
-            segment_count=rank_result['segment_count'],
-            total_students=rank_result['total_students'],
-            total_students_inner=rank_result['total_students_inner'],
-            percentage=rank_result['percentage'],
-            inner_percentage=rank_result['inner_percentage'],
-            analysis=analysis
-        )
+        # 直接返回与 RankResponse 结构一致的字典，跳过响应模型的重复校验
+        return ORJSONResponse(content={
+            "score": query.score,
+            "rank": rank_result['rank'],
+            "inner_rank": rank_result['inner_rank'],
+            "rank_range": rank_result['rank_range'],
+            "segment_count": rank_result['segment_count'],
+            "total_students": rank_result['total_students'],
+            "total_students_inner": rank_result['total_students_inner'],
+            "percentage": rank_result['percentage'],
+            "inner_percentage": rank_result['inner_percentage'],
+            "analysis": analysis
+        })
         
     except Exception as e:
-        print(f"❌ [DEBUG] 查询失败: {str(e)}")
-        print(f"❌ [DEBUG] 错误类型: {type(e).__name__}")
-        import traceback
-        print(f"❌ [DEBUG] 错误堆栈: {traceback.format_exc()}")
+        logger.exception("查询失败: score=%s", query.score)
         
         # 记录错误请求
         request_logger.log_request(
             endpoint="/rank",
             api_key=api_key,
-            is_valid_key=is_valid if 'is_valid' in locals() else False,
+            is_valid_key=is_valid,
             status_code=500,
-            response_time=time.time() - start_time,
+            response_time=time.perf_counter() - start_time,
             client_ip=client_ip,
             user_agent=user_agent,
             request_data={"score": query.score},
@@ -289,41 +474,40 @@ async def query_rank(
             detail=f"查询失败：{str(e)}"
         )
 
+@lru_cache(maxsize=4)
+def _stats_payload(year: int) -> Optional[tuple]:
+    """构建指定年份的统计响应，返回（JSON字节, ETag）（数据为静态数据，按年份缓存；数据更新后调用 cache_clear()）"""
+    # 单次遍历获取基础统计信息和分数段分布
+    stats, score_distribution = get_year_summary(year)
+    if not stats:
+        return None
+    
+    payload = orjson.dumps({
+        "year": year,
+        "region": "天津市六区",
+        "max_score": stats['max_score'],
+        "min_score": stats['min_score'],
+        "total_students": stats['total_students'],
+        "score_distribution": score_distribution
+    })
+    return payload, _make_etag(payload)
+
 @app.get("/stats")
-async def get_statistics():
+async def get_statistics(request: Request):
     """获取2025年市六区统计信息"""
-    print(f"🔍 [DEBUG] /stats 请求开始")
-    
     try:
-        print(f"🔍 [DEBUG] 从静态数据获取统计信息...")
-        
-        # 获取基础统计信息
-        stats = get_year_stats(2025)
-        if not stats:
-            raise HTTPException(status_code=404, detail="未找到2025年数据")
+        cached = _stats_payload(QUERY_YEAR)
+        if cached is None:
+            raise HTTPException(status_code=404, detail=f"未找到{QUERY_YEAR}年数据")
         
-        print(f"🔍 [DEBUG] 基础统计查询完成: {stats}")
-        
-        # 获取分数段分布
-        score_distribution = get_score_distribution(2025)
-        print(f"🔍 [DEBUG] 分数分布查询完成: {score_distribution}")
-        
-        response_data = {
-            "year": 2025,
-            "region": "天津市六区",
-            "max_score": stats['max_score'],
-            "min_score": stats['min_score'],
-            "total_students": stats['total_students'],
-            "score_distribution": score_distribution
-        }
-        print(f"🔍 [DEBUG] /stats 响应数据准备完成")
-        return response_data
+        # 直接返回预先序列化的字节，热路径上不再重复序列化
+        payload, etag = cached
+        return _cached_json_response(request, payload, etag)
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ [DEBUG] /stats 错误: {str(e)}")
-        print(f"❌ [DEBUG] 错误类型: {type(e).__name__}")
-        import traceback
-        print(f"❌ [DEBUG] 错误堆栈: {traceback.format_exc()}")
+        logger.exception("获取统计信息失败")
         raise HTTPException(
             status_code=500,
             detail=f"获取统计信息失败：{str(e)}"
@@ -337,11 +521,11 @@ class RecommendationResponse(BaseModel):
     recommendations: dict
     total_schools: int
 
-@app.post("/recommend", response_model=RecommendationResponse)
+@app.post("/recommend", response_model=None, responses={200: {"model": RecommendationResponse}})
 async def get_recommendations(
     request: Request,
     query: RecommendationQuery,
-    api_key: Optional[str] = Header(None, alias="X-API-Key")
+    auth: ApiKeyCheck = Depends(require_api_key)
 ):
     """
     根据市六区位次推荐志愿学校（冲稳保）
@@ -349,38 +533,28 @@ async def get_recommendations(
     - **rank**: 市六区位次（1-40000）
     - **X-API-Key**: API密钥（通过请求头传递）
     """
-    start_time = time.time()
-    print(f"🔍 [DEBUG] 收到推荐请求: rank={query.rank}")
-    
-    # 获取客户端信息
-    client_ip = request.client.host if request.client else "unknown"
-    user_agent = request.headers.get("user-agent", "unknown")
-    
-    # 验证API密钥
+    # 请求开始时间和客户端信息由 RequestContextMiddleware 记录
+    start_time = request.state.start_time
+    client_ip = request.state.client_ip
+    user_agent = request.state.user_agent
+    api_key = auth.api_key
+    is_valid = auth.is_valid
     status_code = 200
-    error_msg = None
     
-    try:
-        is_valid = await verify_api_key_with_delay(api_key)
-    except HTTPException as e:
-        status_code = e.status_code
-        error_msg = e.detail
-        # 记录请求日志
+    # 密钥验证失败（已在依赖中完成延迟），记录请求日志后返回错误
+    if auth.error is not None:
         request_logger.log_request(
             endpoint="/recommend",
             api_key=api_key,
             is_valid_key=False,
-            status_code=status_code,
-            response_time=time.time() - start_time,
+            status_code=auth.error.status_code,
+            response_time=time.perf_counter() - start_time,
             client_ip=client_ip,
             user_agent=user_agent,
             request_data={"rank": query.rank},
-            error=error_msg
+            error=auth.error.detail
         )
-        raise
-    except Exception as e:
-        print(f"❌ [AUTH] 密钥验证异常: {str(e)}")
-        is_valid = False
+        raise auth.error
     
     try:
         # 获取推荐结果
@@ -389,7 +563,10 @@ async def get_recommendations(
         # 计算总推荐学校数
         total_schools = sum(len(schools) for schools in recommendations.values())
         
-        print(f"🔍 [DEBUG] 推荐完成: 冲{len(recommendations['冲'])}所，稳{len(recommendations['稳'])}所，保{len(recommendations['保'])}所")
+        logger.debug(
+            "推荐完成: 冲%d所，稳%d所，保%d所",
+            len(recommendations['冲']), len(recommendations['稳']), len(recommendations['保'])
+        )
         
         # 无论是否有有效密钥，都返回真实数据
         # （延迟和错误已经在 verify_api_key_with_delay 中处理）
@@ -400,30 +577,28 @@ async def get_recommendations(
             api_key=api_key,
             is_valid_key=is_valid,
             status_code=status_code,
-            response_time=time.time() - start_time,
+            response_time=time.perf_counter() - start_time,
             client_ip=client_ip,
             user_agent=user_agent,
             request_data={"rank": query.rank}
         )
         
-        return RecommendationResponse(
-            rank=query.rank,
-            recommendations=recommendations,
-            total_schools=total_schools
-        )
+        return ORJSONResponse(content={
+            "rank": query.rank,
+            "recommendations": recommendations,
+            "total_schools": total_schools
+        })
         
     except Exception as e:
-        print(f"❌ [DEBUG] 推荐失败: {str(e)}")
-        import traceback
-        print(f"❌ [DEBUG] 错误堆栈: {traceback.format_exc()}")
+        logger.exception("推荐失败: rank=%s", query.rank)
         
         # 记录错误请求
         request_logger.log_request(
             endpoint="/recommend",
             api_key=api_key,
-            is_valid_key=is_valid if 'is_valid' in locals() else False,
+            is_valid_key=is_valid,
             status_code=500,
-            response_time=time.time() - start_time,
+            response_time=time.perf_counter() - start_time,
             client_ip=client_ip,
             user_agent=user_agent,
             request_data={"rank": query.rank},
@@ -437,4 +612,17 @@ async def get_recommendations(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8008)
\ No newline at end of file
+    # 请求日志以 O_APPEND 追加写入 JSONL，多进程不会互相覆盖；但每个进程各自维护
+    # 内存中的请求计数和 get_stats 结果，并各自重写 key_stats.json（后写入的覆盖先写入的），
+    # 统计会按进程分裂，因此默认单进程，可通过 API_WORKERS 环境变量调整
+    workers = int(os.getenv("API_WORKERS", "1"))
+    uvicorn.run(
+        app if workers == 1 else "api:app",  # 多进程需要以导入字符串启动
+        host="0.0.0.0",
+        port=8008,
+        workers=workers,
+        loop="auto",   # 已安装 uvloop 时自动使用
+        http="auto",   # 已安装 httptools 时自动使用
+        log_level="warning",
+        access_log=False  # /rank、/recommend 请求已由 request_logger 记录
+    )
\ No newline at end of file
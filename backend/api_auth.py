@@ -3,12 +3,15 @@ API密钥验证模块
 实现密钥验证、随机延迟和错误生成
 """
 import asyncio
+import logging
 import random
-import time
+from functools import lru_cache
 from typing import Optional, Tuple
 from fastapi import HTTPException, Header
 import hashlib
-import os
+import hmac
+
+logger = logging.getLogger(__name__)
 
 # 有效的API密钥（实际应用中应该从环境变量或安全存储中读取）
 # 这里使用哈希值存储，避免明文密钥
@@ -28,6 +31,9 @@ EXAMPLE_VALID_KEYS = [
     "GAOKAO-HELPER-2025"
 ]
 
+# 示例密钥的集合形式，用于O(1)查找
+_EXAMPLE_VALID_KEY_SET = frozenset(EXAMPLE_VALID_KEYS)
+
 # 随机错误消息
 ERROR_MESSAGES = [
     "服务器繁忙，请稍后重试",
@@ -43,6 +49,27 @@ ERROR_MESSAGES = [
 # HTTP状态码选择
 ERROR_STATUS_CODES = [500, 502, 503, 504, 429]
 
+# 模块级随机数生成器（延迟和错误均为演示用途，无需密码学强度）
+_rng = random.Random()
+
+
+def _draw_denial() -> Tuple[float, Optional[Tuple[int, str]]]:
+    """
+    一次性抽取无效密钥的处理结果
+    
+    返回:
+        (延迟秒数, (状态码, 错误消息) 或 None)，None 表示不报错
+    """
+    # 无效密钥：添加随机延迟（3-10秒）
+    delay = _rng.uniform(3.0, 10.0)
+    
+    # 随机决定是否报错（70%概率报错）
+    if _rng.random() < 0.7:
+        # 随机选择错误消息和状态码
+        return delay, (_rng.choice(ERROR_STATUS_CODES), _rng.choice(ERROR_MESSAGES))
+    
+    return delay, None
+
 
 def hash_api_key(key: str) -> str:
     """对API密钥进行SHA256哈希"""
@@ -62,13 +89,19 @@ def validate_api_key(api_key: Optional[str]) -> bool:
     if not api_key:
         return False
     
+    return _is_known_key(api_key)
+
+
+@lru_cache(maxsize=1024)
+def _is_known_key(api_key: str) -> bool:
+    """校验密钥（按密钥缓存，同一客户端重复请求无需重新计算哈希；修改密钥集合后需调用 cache_clear()）"""
     # 检查是否是示例密钥（开发环境）
-    if api_key in EXAMPLE_VALID_KEYS:
+    if api_key in _EXAMPLE_VALID_KEY_SET:
         return True
     
-    # 计算密钥的哈希值并验证
+    # 计算密钥的哈希值并验证（使用常量时间比较，避免时序泄露）
     key_hash = hash_api_key(api_key)
-    return key_hash in VALID_API_KEY_HASHES
+    return any(hmac.compare_digest(key_hash, valid_hash) for valid_hash in VALID_API_KEY_HASHES)
 
 
 async def verify_api_key_with_delay(api_key: Optional[str] = Header(None, alias="X-API-Key")) -> bool:
@@ -88,18 +121,14 @@ async def verify_api_key_with_delay(api_key: Optional[str] = Header(None, alias=
     if validate_api_key(api_key):
         return True
     
-    # 无效密钥：添加随机延迟（3-10秒）
-    delay = random.uniform(3.0, 10.0)
-    print(f"🚫 [AUTH] 无效或缺失API密钥，延迟 {delay:.2f} 秒")
+    # 先确定结果再等待，延迟期间只挂起当前请求的协程，不占用工作线程
+    delay, error = _draw_denial()
+    logger.debug("无效或缺失API密钥，延迟 %.2f 秒", delay)
     await asyncio.sleep(delay)
     
-    # 随机决定是否报错（70%概率报错）
-    if random.random() < 0.7:
-        # 随机选择错误消息和状态码
-        error_msg = random.choice(ERROR_MESSAGES)
-        status_code = random.choice(ERROR_STATUS_CODES)
-        
-        print(f"🚫 [AUTH] 返回错误: {status_code} - {error_msg}")
+    if error is not None:
+        status_code, error_msg = error
+        logger.debug("返回错误: %s - %s", status_code, error_msg)
         raise HTTPException(status_code=status_code, detail=error_msg)
     
     # 30%概率返回成功（虽然密钥无效，但仍会返回真实数据）
@@ -108,29 +137,31 @@ async def verify_api_key_with_delay(api_key: Optional[str] = Header(None, alias=
 
 def get_demo_api_key() -> str:
     """获取一个演示用的有效API密钥"""
-    return random.choice(EXAMPLE_VALID_KEYS)
+    return _rng.choice(EXAMPLE_VALID_KEYS)
 
 
 def should_blur_data() -> bool:
     """决定是否应该模糊数据（用于无效密钥但未报错的情况）"""
-    return random.random() < 0.8  # 80%概率返回模糊数据
+    return _rng.random() < 0.8  # 80%概率返回模糊数据
 
 
 def blur_rank_data(original_rank: int) -> int:
     """模糊化位次数据"""
     # 添加±5-20%的随机偏差
-    deviation = random.uniform(0.05, 0.20)
-    direction = random.choice([-1, 1])
-    blurred = int(original_rank * (1 + direction * deviation))
+    deviation = _rng.uniform(0.05, 0.20)
+    if _rng.random() < 0.5:
+        deviation = -deviation
+    blurred = int(original_rank * (1 + deviation))
     return max(1, blurred)  # 确保位次至少为1
 
 
 def blur_score_data(original_score: float) -> float:
     """模糊化分数数据"""
     # 添加±2-10分的随机偏差
-    deviation = random.uniform(2.0, 10.0)
-    direction = random.choice([-1, 1])
-    blurred = original_score + (direction * deviation)
+    deviation = _rng.uniform(2.0, 10.0)
+    if _rng.random() < 0.5:
+        deviation = -deviation
+    blurred = original_score + deviation
     return round(max(0, min(800, blurred)), 2)  # 确保分数在0-800范围内
 
 
@@ -86,8 +86,9 @@ def validate_score(score: float) -> bool:
         return False
     
     # 检查精度（保留两位小数）
-    # 使用乘以100后检查是否为整数的方式
-    if round(score * 100) != score * 100:
+    # 换算为整数0.01分后必须能还原为原值；直接比较 score * 100 会因浮点误差
+    # 误判 0.07、1.1 等合法分数
+    if round(score * 100) / 100 != score:
         return False
     
     return True
@@ -3,6 +3,7 @@
 使用静态数据替代数据库
 """
 import logging
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -22,9 +23,9 @@ from data import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreRecord:
-    """分数记录数据模型"""
+    """分数记录数据模型（使用 __slots__，减少实例内存和属性访问开销）"""
     year: int
     score: int
     inner_six: int
@@ -43,39 +44,134 @@ class ScoreRecord:
 # 数据库连接类已被移除，现在直接使用静态数据
 
 
+def _build_score_arrays() -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """按年份构建结构数组（SoA）：分数升序数组及对应的市六区累计人数数组"""
+    arrays = {}
+    for year in get_available_years():
+        year_data = sorted(
+            (record for record in get_data_by_year(year) if record['inner_six'] > 0),
+            key=lambda x: x['score']
+        )
+        arrays[year] = (
+            np.array([record['score'] for record in year_data], dtype=np.float64),
+            np.array([record['inner_six'] for record in year_data], dtype=np.int64)
+        )
+    return arrays
+
+
+def _build_segment_counts(score_arrays: Dict[int, Tuple[np.ndarray, np.ndarray]]) -> Dict[int, Dict[float, int]]:
+    """按年份预计算每个分数的分数段人数（当前分数累计人数 - 上一分累计人数）"""
+    segment_counts = {}
+    for year, (scores, cumulative) in score_arrays.items():
+        count_by_score = dict(zip(scores.tolist(), cumulative.tolist()))
+        segment_counts[year] = {
+            score: max(0, count - count_by_score.get(score + 1, 0))
+            for score, count in count_by_score.items()
+        }
+    return segment_counts
+
+
+def _build_percentile_index() -> Dict[int, Tuple[np.ndarray, List[Any]]]:
+    """按年份预先构建 (按累计人数升序的数组, 对应分数列表)，供百分位查询二分查找"""
+    index = {}
+    for year in get_available_years():
+        year_data = sorted(get_data_by_year(year), key=lambda x: x['inner_six'])
+        cumulative = np.array([record['inner_six'] for record in year_data], dtype=np.int64)
+        index[year] = (cumulative, [record['score'] for record in year_data])
+    return index
+
+
+# 模块加载时构建一次，热路径上直接二分查找或查表，不再构造 ScoreRecord
+_SCORE_ARRAYS = _build_score_arrays()
+_SEGMENT_COUNTS = _build_segment_counts(_SCORE_ARRAYS)
+_PERCENTILE_INDEX = _build_percentile_index()
+
+
+def _total_students(year: int) -> int:
+    """指定年份的总学生数（最大的市六区累计人数），无数据时为0"""
+    arrays = _SCORE_ARRAYS.get(year)
+    if arrays is None or len(arrays[1]) == 0:
+        return 0
+    return int(arrays[1].max())
+
+
+@lru_cache(maxsize=1024)
+def _percentile_score(year: int, percentile: float) -> Optional[Any]:
+    """按（年份，百分位）缓存百分位对应的分数"""
+    total_students = _total_students(year)
+    if total_students == 0:
+        return None
+    
+    # 计算目标排名
+    target_rank = int(total_students * (1 - percentile / 100))
+    
+    # 二分查找第一个累计人数 >= 目标排名的分数
+    cumulative, scores = _PERCENTILE_INDEX[year]
+    idx = int(np.searchsorted(cumulative, target_rank, side='left'))
+    if idx < len(scores):
+        return scores[idx]
+    
+    return None
+
+
+@lru_cache(maxsize=32)
+def _score_statistics(year: int) -> Dict[str, Any]:
+    """按年份缓存分数统计信息（返回给调用方前需复制）"""
+    stats = get_year_stats(year)
+    if stats:
+        return {
+            "max_score": stats['max_score'],
+            "min_score": stats['min_score'],
+            "score_levels": stats['record_count'],
+            "total_students": stats['total_students'],
+            "year": year
+        }
+    return {}
+
+
+@lru_cache(maxsize=32)
+def _load_score_records(year: int) -> List[ScoreRecord]:
+    """按年份构建分数记录列表（按分数降序，结果缓存并共享，调用方不应修改）"""
+    records = [
+        ScoreRecord(
+            year=record['year'],
+            score=record['score'],
+            inner_six=record['inner_six']
+        )
+        for record in get_data_by_year(year) if record['inner_six'] > 0
+    ]
+    
+    # 按分数降序排列
+    records.sort(key=lambda x: x.score, reverse=True)
+    return records
+
+
 class ScoreDAO:
     """分数数据访问对象 - 使用静态数据"""
     
     def __init__(self):
-        self._cache = {}  # 简单的内存缓存
+        # 数据为静态数据，初始化时预先构建所有年份的记录，首个请求无需承担构建开销
+        for year in get_available_years():
+            self.get_score_records(year)
     
     def get_score_records(self, year: int) -> List[ScoreRecord]:
         """获取指定年份的所有分数记录"""
-        cache_key = f"records_{year}"
-        
-        # 检查缓存
-        if cache_key in self._cache:
-            logger.debug(f"从缓存获取 {year} 年数据")
-            return self._cache[cache_key]
-        
-        # 从静态数据获取
-        year_data = get_data_by_year(year)
-        records = [
-            ScoreRecord(
-                year=record['year'],
-                score=record['score'],
-                inner_six=record['inner_six']
-            )
-            for record in year_data if record['inner_six'] > 0
-        ]
-        
-        # 按分数降序排列
-        records.sort(key=lambda x: x.score, reverse=True)
-        
-        # 存入缓存
-        self._cache[cache_key] = records
-        
-        return records
+        return _load_score_records(year)
+    
+    def get_score_arrays(self, year: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """获取指定年份的 (分数升序数组, 市六区累计人数数组)，无数据时返回None"""
+        return _SCORE_ARRAYS.get(year)
+    
+    def get_inner_six(self, year: int, score: float) -> Optional[int]:
+        """获取特定年份和分数的市六区累计人数，分数不存在时返回None"""
+        arrays = _SCORE_ARRAYS.get(year)
+        if arrays is None:
+            return None
+        scores, cumulative = arrays
+        idx = int(np.searchsorted(scores, score))
+        if idx < len(scores) and scores[idx] == score:
+            return int(cumulative[idx])
+        return None
     
     def get_score_record(self, year: int, score: int) -> Optional[ScoreRecord]:
         """获取特定年份和分数的记录"""
@@ -113,53 +209,21 @@ class ScoreDAO:
     
     def get_total_students(self, year: int) -> int:
         """获取指定年份的总学生数"""
-        cache_key = f"total_{year}"
-        
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        # 从静态数据获取最大inner_six值
-        year_data = get_data_by_year(year)
-        total = max((record['inner_six'] for record in year_data), default=0)
-        
-        self._cache[cache_key] = total
-        
-        return total
+        # 最大的市六区累计人数即总人数
+        return _total_students(year)
     
     def get_segment_count(self, year: int, score: float) -> int:
         """获取当前分数段的人数
         
         计算方法：当前分数的累计人数 - 上一分（+1分）的累计人数
+        结果在模块加载时已预计算，数据中不存在的分数段人数为0
         """
         # 向下取整到整数分数
-        current_score = int(score)
-        next_score = current_score + 1
-        
-        # 获取当前分数的累计人数
-        current_record = self.get_score_record(year, current_score)
-        current_count = current_record.inner_six if current_record else 0
-        
-        # 获取上一分的累计人数
-        next_record = self.get_score_record(year, next_score)
-        next_count = next_record.inner_six if next_record else 0
-        
-        # 分数段人数 = 当前累计 - 上一分累计
-        segment_count = current_count - next_count
-        
-        return max(0, segment_count)  # 确保不返回负数
+        return _SEGMENT_COUNTS.get(year, {}).get(int(score), 0)
     
     def get_score_statistics(self, year: int) -> Dict[str, Any]:
         """获取分数统计信息"""
-        stats = get_year_stats(year)
-        if stats:
-            return {
-                "max_score": stats['max_score'],
-                "min_score": stats['min_score'],
-                "score_levels": stats['record_count'],
-                "total_students": stats['total_students'],
-                "year": year
-            }
-        return {}
+        return dict(_score_statistics(year))
     
     def get_score_distribution(self, year: int) -> List[Dict[str, Any]]:
         """获取分数段分布"""
@@ -170,26 +234,13 @@ class ScoreDAO:
         if not 0 <= percentile <= 100:
             raise ValueError("百分位必须在0-100之间")
         
-        total_students = self.get_total_students(year)
-        if total_students == 0:
-            return None
-        
-        # 计算目标排名
-        target_rank = int(total_students * (1 - percentile / 100))
-        
-        # 从静态数据中查找
-        year_data = get_data_by_year(year)
-        year_data.sort(key=lambda x: x['inner_six'])
-        
-        for record in year_data:
-            if record['inner_six'] >= target_rank:
-                return record['score']
-        
-        return None
+        return _percentile_score(year, percentile)
     
     def clear_cache(self):
         """清空缓存"""
-        self._cache.clear()
+        _load_score_records.cache_clear()
+        _percentile_score.cache_clear()
+        _score_statistics.cache_clear()
         logger.info("缓存已清空")
     
     def get_years(self) -> List[int]:
@@ -197,7 +248,7 @@ class ScoreDAO:
         return get_available_years()
     
     def verify_data(self) -> bool:
-        """验证数据完整性"""
+        """验证数据完整性，并预热各年份的缓存"""
         try:
             # 检查是否有数据
             if not SCORE_RECORDS:
@@ -209,6 +260,11 @@ class ScoreDAO:
                 logger.error("没有可用年份数据")
                 return False
             
+            # 预热缓存，之后的查询直接命中内存中的结果
+            for year in years:
+                self.get_score_records(year)
+                self.get_score_statistics(year)
+            
             logger.info(f"数据验证通过，包含 {len(SCORE_RECORDS)} 条记录，年份: {years}")
             return True
             
@@ -3,6 +3,9 @@
 替代数据库，直接使用Python数据结构
 """
 
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
 # 中考成绩数据 - 所有记录
 SCORE_RECORDS = [
     {"year": 2022, "score": 764, "total_city": 6241, "inner_six": 3653},
@@ -861,93 +864,125 @@ SCORE_RECORDS = [
     {"year": 2025, "score": 500.0, "total_city": 100244, "inner_six": 36592},
 ]
 
+# 进程级索引：模块加载时构建一次，查询时不再全表扫描
+_RECORDS_BY_YEAR = {}
+_RECORD_BY_YEAR_SCORE = {}
+for _record in SCORE_RECORDS:
+    _RECORDS_BY_YEAR.setdefault(_record['year'], []).append(_record)
+    _RECORD_BY_YEAR_SCORE.setdefault((_record['year'], _record['score']), _record)
+del _record
+
+# 按年份的 (分数升序列表, 对应记录列表)，供相邻分数二分查找
+_SORTED_BY_YEAR = {}
+for _year, _records in _RECORDS_BY_YEAR.items():
+    _records = sorted(_records, key=lambda x: x['score'])
+    _SORTED_BY_YEAR[_year] = ([record['score'] for record in _records], _records)
+del _year, _records
+
 # 数据操作函数
 
 def get_data_by_year(year: int):
     """获取指定年份的数据"""
-    return [record for record in SCORE_RECORDS if record['year'] == year]
+    # 返回副本，调用方可能会对结果排序
+    return list(_RECORDS_BY_YEAR.get(year, ()))
 
 def get_available_years():
     """获取所有可用年份"""
-    return sorted(set(record['year'] for record in SCORE_RECORDS))
+    return sorted(_RECORDS_BY_YEAR)
 
 def get_year_stats(year: int):
     """获取指定年份的统计信息"""
-    year_data = get_data_by_year(year)
-    if not year_data:
-        return None
-    
-    scores = [record['score'] for record in year_data]
-    total_students = max(record['inner_six'] for record in year_data)
-    
-    return {
-        'year': year,
-        'max_score': max(scores),
-        'min_score': min(scores),
-        'total_students': total_students,
-        'record_count': len(year_data)
-    }
+    stats = _year_summary(year)[0]
+    return dict(stats) if stats else None
 
 def find_record_by_score(year: int, score: int):
     """查找指定年份和分数的记录"""
-    for record in SCORE_RECORDS:
-        if record['year'] == year and record['score'] == score:
-            return record
-    return None
+    return _RECORD_BY_YEAR_SCORE.get((year, score))
 
 def get_adjacent_records(year: int, score: float):
-    """获取相邻的两个分数记录（用于插值）"""
-    year_data = get_data_by_year(year)
-    year_data.sort(key=lambda x: x['score'], reverse=True)
+    """获取相邻的两个分数记录（用于插值）
     
-    higher_record = None
-    lower_record = None
+    返回 (高于score的最低分记录, 低于score的最高分记录)，不存在时为None
+    """
+    scores, records = _SORTED_BY_YEAR.get(year, ((), ()))
     
-    for record in year_data:
-        if record['score'] > score:
-            higher_record = record
-        elif record['score'] < score:
-            lower_record = record
-            break
+    # 二分查找定位，跳过与score相等的记录
+    lower_index = bisect_left(scores, score)
+    higher_index = bisect_right(scores, score, lower_index)
+    
+    higher_record = records[higher_index] if higher_index < len(records) else None
+    lower_record = records[lower_index - 1] if lower_index > 0 else None
     
     return higher_record, lower_record
 
+def _add_to_distribution(distribution: dict, record: dict):
+    """将一条记录累加到对应的分数段"""
+    score = record['score']
+    if score >= 750:
+        range_key = '750分以上'
+    elif score >= 700:
+        range_key = '700-749分'
+    elif score >= 650:
+        range_key = '650-699分'
+    elif score >= 600:
+        range_key = '600-649分'
+    elif score >= 550:
+        range_key = '550-599分'
+    else:
+        range_key = '550分以下'
+    
+    if range_key not in distribution:
+        distribution[range_key] = {
+            'range': range_key,
+            'min_score': score,
+            'max_score': score,
+            'count': record['inner_six']
+        }
+    else:
+        distribution[range_key]['min_score'] = min(distribution[range_key]['min_score'], score)
+        distribution[range_key]['max_score'] = max(distribution[range_key]['max_score'], score)
+        distribution[range_key]['count'] = max(distribution[range_key]['count'], record['inner_six'])
+
 def get_score_distribution(year: int):
     """获取分数段分布"""
-    year_data = get_data_by_year(year)
+    return [dict(item) for item in _year_summary(year)[1]]
+
+def get_year_summary(year: int):
+    """同时获取统计信息和分数段分布
+
+    返回 (stats, distribution)，结果与 get_year_stats / get_score_distribution 一致。
+    """
+    stats, distribution = _year_summary(year)
+    return (dict(stats) if stats else None), [dict(item) for item in distribution]
+
+@lru_cache(maxsize=32)
+def _year_summary(year: int):
+    """单次遍历计算统计信息和分数段分布（静态数据，按年份缓存，返回给调用方前需复制）"""
+    year_data = _RECORDS_BY_YEAR.get(year)
     if not year_data:
-        return []
+        return None, []
     
-    # 按分数段分组
+    max_score = min_score = year_data[0]['score']
+    total_students = year_data[0]['inner_six']
     distribution = {}
     for record in year_data:
         score = record['score']
-        if score >= 750:
-            range_key = '750分以上'
-        elif score >= 700:
-            range_key = '700-749分'
-        elif score >= 650:
-            range_key = '650-699分'
-        elif score >= 600:
-            range_key = '600-649分'
-        elif score >= 550:
-            range_key = '550-599分'
-        else:
-            range_key = '550分以下'
-        
-        if range_key not in distribution:
-            distribution[range_key] = {
-                'range': range_key,
-                'min_score': score,
-                'max_score': score,
-                'count': record['inner_six']
-            }
-        else:
-            distribution[range_key]['min_score'] = min(distribution[range_key]['min_score'], score)
-            distribution[range_key]['max_score'] = max(distribution[range_key]['max_score'], score)
-            distribution[range_key]['count'] = max(distribution[range_key]['count'], record['inner_six'])
+        if score > max_score:
+            max_score = score
+        if score < min_score:
+            min_score = score
+        if record['inner_six'] > total_students:
+            total_students = record['inner_six']
+        _add_to_distribution(distribution, record)
     
-    return list(distribution.values())
+    stats = {
+        'year': year,
+        'max_score': max_score,
+        'min_score': min_score,
+        'total_students': total_students,
+        'record_count': len(year_data)
+    }
+    return stats, list(distribution.values())
 
 def validate_data():
     """验证数据完整性"""
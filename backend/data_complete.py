@@ -1,575 +0,0 @@
-# 中考成绩数据 - 所有记录
-SCORE_RECORDS = [
-    {"year": 2022, "score": 764, "total_city": 6241, "inner_six": 3653},
-    {"year": 2022, "score": 756, "total_city": 10095, "inner_six": 5460},
-    {"year": 2022, "score": 749, "total_city": 13831, "inner_six": 7025},
-    {"year": 2022, "score": 743, "total_city": 17111, "inner_six": 8302},
-    {"year": 2022, "score": 735, "total_city": 21623, "inner_six": 9955},
-    {"year": 2022, "score": 728, "total_city": 25383, "inner_six": 11280},
-    {"year": 2022, "score": 722, "total_city": 28379, "inner_six": 12248},
-    {"year": 2022, "score": 714, "total_city": 32304, "inner_six": 13539},
-    {"year": 2022, "score": 707, "total_city": 35586, "inner_six": 14569},
-    {"year": 2022, "score": 701, "total_city": 38253, "inner_six": 15382},
-    {"year": 2022, "score": 693, "total_city": 41648, "inner_six": 16380},
-    {"year": 2022, "score": 686, "total_city": 44374, "inner_six": 17157},
-    {"year": 2022, "score": 680, "total_city": 46588, "inner_six": 17782},
-    {"year": 2022, "score": 672, "total_city": 49495, "inner_six": 18537},
-    {"year": 2022, "score": 665, "total_city": 51831, "inner_six": 19155},
-    {"year": 2022, "score": 659, "total_city": 53739, "inner_six": 19606},
-    {"year": 2022, "score": 651, "total_city": 56176, "inner_six": 20246},
-    {"year": 2022, "score": 644, "total_city": 58148, "inner_six": 20768},
-    {"year": 2022, "score": 638, "total_city": 59783, "inner_six": 21195},
-    {"year": 2022, "score": 630, "total_city": 61779, "inner_six": 21667},
-    {"year": 2022, "score": 623, "total_city": 63471, "inner_six": 22044},
-    {"year": 2022, "score": 617, "total_city": 64831, "inner_six": 22368},
-    {"year": 2022, "score": 609, "total_city": 66577, "inner_six": 22800},
-    {"year": 2022, "score": 602, "total_city": 68044, "inner_six": 23149},
-    {"year": 2022, "score": 596, "total_city": 69213, "inner_six": 23416},
-    {"year": 2022, "score": 588, "total_city": 70669, "inner_six": 23782},
-    {"year": 2022, "score": 581, "total_city": 71917, "inner_six": 24102},
-    {"year": 2022, "score": 575, "total_city": 72945, "inner_six": 24329},
-    {"year": 2022, "score": 567, "total_city": 74238, "inner_six": 24613},
-    {"year": 2022, "score": 560, "total_city": 75360, "inner_six": 24860},
-    {"year": 2022, "score": 554, "total_city": 76261, "inner_six": 25062},
-    {"year": 2022, "score": 546, "total_city": 77392, "inner_six": 25337},
-    {"year": 2022, "score": 539, "total_city": 78390, "inner_six": 25570},
-    {"year": 2022, "score": 533, "total_city": 79255, "inner_six": 25763},
-    {"year": 2022, "score": 525, "total_city": 80363, "inner_six": 26034},
-    {"year": 2022, "score": 518, "total_city": 81187, "inner_six": 26224},
-    {"year": 2022, "score": 512, "total_city": 81961, "inner_six": 26398},
-    {"year": 2022, "score": 504, "total_city": 82957, "inner_six": 26603},
-    {"year": 2023, "score": 752, "total_city": 7399, "inner_six": 4411},
-    {"year": 2023, "score": 751, "total_city": 7828, "inner_six": 4629},
-    {"year": 2023, "score": 750, "total_city": 8274, "inner_six": 4854},
-    {"year": 2023, "score": 749, "total_city": 8763, "inner_six": 5106},
-    {"year": 2023, "score": 748, "total_city": 9227, "inner_six": 5345},
-    {"year": 2023, "score": 747, "total_city": 9682, "inner_six": 5561},
-    {"year": 2023, "score": 746, "total_city": 10150, "inner_six": 5783},
-    {"year": 2023, "score": 745, "total_city": 10597, "inner_six": 6017},
-    {"year": 2023, "score": 744, "total_city": 11049, "inner_six": 6263},
-    {"year": 2023, "score": 743, "total_city": 11516, "inner_six": 6503},
-    {"year": 2023, "score": 742, "total_city": 11982, "inner_six": 6705},
-    {"year": 2023, "score": 741, "total_city": 12452, "inner_six": 6929},
-    {"year": 2023, "score": 740, "total_city": 12958, "inner_six": 7161},
-    {"year": 2023, "score": 739, "total_city": 13484, "inner_six": 7403},
-    {"year": 2023, "score": 738, "total_city": 14016, "inner_six": 7637},
-    {"year": 2023, "score": 737, "total_city": 14523, "inner_six": 7858},
-    {"year": 2023, "score": 736, "total_city": 15065, "inner_six": 8111},
-    {"year": 2023, "score": 735, "total_city": 15577, "inner_six": 8369},
-    {"year": 2023, "score": 734, "total_city": 16143, "inner_six": 8611},
-    {"year": 2023, "score": 733, "total_city": 16669, "inner_six": 8834},
-    {"year": 2023, "score": 732, "total_city": 17217, "inner_six": 9073},
-    {"year": 2023, "score": 731, "total_city": 17731, "inner_six": 9299},
-    {"year": 2023, "score": 730, "total_city": 18276, "inner_six": 9521},
-    {"year": 2023, "score": 729, "total_city": 18773, "inner_six": 9730},
-    {"year": 2023, "score": 728, "total_city": 19347, "inner_six": 9959},
-    {"year": 2023, "score": 727, "total_city": 19923, "inner_six": 10205},
-    {"year": 2023, "score": 726, "total_city": 20482, "inner_six": 10431},
-    {"year": 2023, "score": 725, "total_city": 21054, "inner_six": 10644},
-    {"year": 2023, "score": 724, "total_city": 21638, "inner_six": 10896},
-    {"year": 2023, "score": 723, "total_city": 22196, "inner_six": 11116},
-    {"year": 2023, "score": 722, "total_city": 22720, "inner_six": 11327},
-    {"year": 2023, "score": 721, "total_city": 23234, "inner_six": 11533},
-    {"year": 2023, "score": 720, "total_city": 23809, "inner_six": 11748},
-    {"year": 2023, "score": 719, "total_city": 24348, "inner_six": 11937},
-    {"year": 2023, "score": 718, "total_city": 24885, "inner_six": 12152},
-    {"year": 2023, "score": 717, "total_city": 25465, "inner_six": 12378},
-    {"year": 2023, "score": 716, "total_city": 26048, "inner_six": 12599},
-    {"year": 2023, "score": 715, "total_city": 26613, "inner_six": 12804},
-    {"year": 2023, "score": 714, "total_city": 27138, "inner_six": 13014},
-    {"year": 2023, "score": 713, "total_city": 27697, "inner_six": 13227},
-    {"year": 2023, "score": 712, "total_city": 28220, "inner_six": 13434},
-    {"year": 2023, "score": 711, "total_city": 28764, "inner_six": 13631},
-    {"year": 2023, "score": 710, "total_city": 29286, "inner_six": 13844},
-    {"year": 2023, "score": 709, "total_city": 29834, "inner_six": 14030},
-    {"year": 2023, "score": 708, "total_city": 30363, "inner_six": 14212},
-    {"year": 2023, "score": 707, "total_city": 30927, "inner_six": 14424},
-    {"year": 2023, "score": 706, "total_city": 31490, "inner_six": 14645},
-    {"year": 2023, "score": 705, "total_city": 32035, "inner_six": 14828},
-    {"year": 2023, "score": 704, "total_city": 32591, "inner_six": 15025},
-    {"year": 2023, "score": 703, "total_city": 33153, "inner_six": 15239},
-    {"year": 2023, "score": 702, "total_city": 33668, "inner_six": 15402},
-    {"year": 2023, "score": 701, "total_city": 34178, "inner_six": 15568},
-    {"year": 2023, "score": 700, "total_city": 34730, "inner_six": 15773},
-    {"year": 2023, "score": 699, "total_city": 35272, "inner_six": 15962},
-    {"year": 2023, "score": 698, "total_city": 35751, "inner_six": 16107},
-    {"year": 2023, "score": 697, "total_city": 36263, "inner_six": 16297},
-    {"year": 2023, "score": 696, "total_city": 36794, "inner_six": 16482},
-    {"year": 2023, "score": 695, "total_city": 37292, "inner_six": 16623},
-    {"year": 2023, "score": 694, "total_city": 37777, "inner_six": 16785},
-    {"year": 2023, "score": 693, "total_city": 38265, "inner_six": 16945},
-    {"year": 2023, "score": 692, "total_city": 38747, "inner_six": 17102},
-    {"year": 2023, "score": 691, "total_city": 39263, "inner_six": 17260},
-    {"year": 2023, "score": 690, "total_city": 39781, "inner_six": 17443},
-    {"year": 2023, "score": 689, "total_city": 40263, "inner_six": 17599},
-    {"year": 2023, "score": 688, "total_city": 40761, "inner_six": 17761},
-    {"year": 2023, "score": 687, "total_city": 41222, "inner_six": 17902},
-    {"year": 2023, "score": 686, "total_city": 41718, "inner_six": 18077},
-    {"year": 2023, "score": 685, "total_city": 42165, "inner_six": 18220},
-    {"year": 2023, "score": 684, "total_city": 42622, "inner_six": 18366},
-    {"year": 2023, "score": 683, "total_city": 43080, "inner_six": 18507},
-    {"year": 2023, "score": 682, "total_city": 43519, "inner_six": 18645},
-    {"year": 2023, "score": 681, "total_city": 43949, "inner_six": 18777},
-    {"year": 2023, "score": 680, "total_city": 44411, "inner_six": 18914},
-    {"year": 2023, "score": 679, "total_city": 44860, "inner_six": 19053},
-    {"year": 2023, "score": 678, "total_city": 45319, "inner_six": 19201},
-    {"year": 2023, "score": 677, "total_city": 45730, "inner_six": 19345},
-    {"year": 2023, "score": 676, "total_city": 46126, "inner_six": 19472},
-    {"year": 2023, "score": 675, "total_city": 46527, "inner_six": 19590},
-    {"year": 2023, "score": 674, "total_city": 46957, "inner_six": 19723},
-    {"year": 2023, "score": 673, "total_city": 47360, "inner_six": 19833},
-    {"year": 2023, "score": 672, "total_city": 47815, "inner_six": 19959},
-    {"year": 2023, "score": 671, "total_city": 48276, "inner_six": 20112},
-    {"year": 2023, "score": 670, "total_city": 48676, "inner_six": 20226},
-    {"year": 2023, "score": 669, "total_city": 49084, "inner_six": 20358},
-    {"year": 2023, "score": 668, "total_city": 49483, "inner_six": 20454},
-    {"year": 2023, "score": 667, "total_city": 49888, "inner_six": 20554},
-    {"year": 2023, "score": 666, "total_city": 50295, "inner_six": 20686},
-    {"year": 2023, "score": 665, "total_city": 50702, "inner_six": 20794},
-    {"year": 2023, "score": 664, "total_city": 51095, "inner_six": 20892},
-    {"year": 2023, "score": 663, "total_city": 51497, "inner_six": 21004},
-    {"year": 2023, "score": 662, "total_city": 51912, "inner_six": 21125},
-    {"year": 2023, "score": 661, "total_city": 52287, "inner_six": 21243},
-    {"year": 2023, "score": 660, "total_city": 52685, "inner_six": 21358},
-    {"year": 2023, "score": 659, "total_city": 53066, "inner_six": 21464},
-    {"year": 2023, "score": 658, "total_city": 53423, "inner_six": 21577},
-    {"year": 2023, "score": 657, "total_city": 53796, "inner_six": 21676},
-    {"year": 2023, "score": 656, "total_city": 54161, "inner_six": 21786},
-    {"year": 2023, "score": 655, "total_city": 54503, "inner_six": 21876},
-    {"year": 2023, "score": 654, "total_city": 54858, "inner_six": 21972},
-    {"year": 2023, "score": 653, "total_city": 55235, "inner_six": 22073},
-    {"year": 2023, "score": 652, "total_city": 55612, "inner_six": 22187},
-    {"year": 2023, "score": 651, "total_city": 55954, "inner_six": 22269},
-    {"year": 2023, "score": 650, "total_city": 56299, "inner_six": 22350},
-    {"year": 2023, "score": 649, "total_city": 56638, "inner_six": 22446},
-    {"year": 2023, "score": 648, "total_city": 56986, "inner_six": 22542},
-    {"year": 2023, "score": 647, "total_city": 57293, "inner_six": 22622},
-    {"year": 2023, "score": 646, "total_city": 57615, "inner_six": 22718},
-    {"year": 2023, "score": 645, "total_city": 57929, "inner_six": 22806},
-    {"year": 2023, "score": 644, "total_city": 58264, "inner_six": 22897},
-    {"year": 2023, "score": 643, "total_city": 58584, "inner_six": 23002},
-    {"year": 2023, "score": 642, "total_city": 58931, "inner_six": 23105},
-    {"year": 2023, "score": 641, "total_city": 59253, "inner_six": 23194},
-    {"year": 2023, "score": 640, "total_city": 59568, "inner_six": 23282},
-    {"year": 2023, "score": 639, "total_city": 59892, "inner_six": 23372},
-    {"year": 2023, "score": 638, "total_city": 60226, "inner_six": 23456},
-    {"year": 2023, "score": 637, "total_city": 60509, "inner_six": 23521},
-    {"year": 2023, "score": 636, "total_city": 60800, "inner_six": 23595},
-    {"year": 2023, "score": 635, "total_city": 61148, "inner_six": 23696},
-    {"year": 2023, "score": 634, "total_city": 61446, "inner_six": 23778},
-    {"year": 2023, "score": 633, "total_city": 61765, "inner_six": 23870},
-    {"year": 2023, "score": 632, "total_city": 62055, "inner_six": 23932},
-    {"year": 2023, "score": 631, "total_city": 62358, "inner_six": 23998},
-    {"year": 2023, "score": 630, "total_city": 62631, "inner_six": 24076},
-    {"year": 2023, "score": 629, "total_city": 62939, "inner_six": 24162},
-    {"year": 2023, "score": 628, "total_city": 63229, "inner_six": 24231},
-    {"year": 2023, "score": 627, "total_city": 63509, "inner_six": 24302},
-    {"year": 2023, "score": 626, "total_city": 63786, "inner_six": 24380},
-    {"year": 2023, "score": 625, "total_city": 64102, "inner_six": 24450},
-    {"year": 2023, "score": 624, "total_city": 64383, "inner_six": 24513},
-    {"year": 2023, "score": 623, "total_city": 64687, "inner_six": 24582},
-    {"year": 2023, "score": 622, "total_city": 64943, "inner_six": 24638},
-    {"year": 2023, "score": 621, "total_city": 65237, "inner_six": 24708},
-    {"year": 2023, "score": 620, "total_city": 65545, "inner_six": 24790},
-    {"year": 2023, "score": 619, "total_city": 65795, "inner_six": 24861},
-    {"year": 2023, "score": 618, "total_city": 66093, "inner_six": 24925},
-    {"year": 2023, "score": 617, "total_city": 66379, "inner_six": 24997},
-    {"year": 2023, "score": 616, "total_city": 66647, "inner_six": 25070},
-    {"year": 2023, "score": 615, "total_city": 66895, "inner_six": 25125},
-    {"year": 2023, "score": 614, "total_city": 67179, "inner_six": 25200},
-    {"year": 2023, "score": 613, "total_city": 67427, "inner_six": 25270},
-    {"year": 2023, "score": 612, "total_city": 67696, "inner_six": 25330},
-    {"year": 2023, "score": 611, "total_city": 67972, "inner_six": 25393},
-    {"year": 2023, "score": 610, "total_city": 68222, "inner_six": 25442},
-    {"year": 2023, "score": 609, "total_city": 68501, "inner_six": 25515},
-    {"year": 2023, "score": 608, "total_city": 68732, "inner_six": 25570},
-    {"year": 2023, "score": 607, "total_city": 68969, "inner_six": 25633},
-    {"year": 2023, "score": 606, "total_city": 69229, "inner_six": 25705},
-    {"year": 2023, "score": 605, "total_city": 69499, "inner_six": 25781},
-    {"year": 2023, "score": 604, "total_city": 69745, "inner_six": 25836},
-    {"year": 2023, "score": 603, "total_city": 69995, "inner_six": 25891},
-    {"year": 2023, "score": 602, "total_city": 70248, "inner_six": 25948},
-    {"year": 2023, "score": 601, "total_city": 70505, "inner_six": 26010},
-    {"year": 2023, "score": 600, "total_city": 70716, "inner_six": 26058},
-    {"year": 2023, "score": 599, "total_city": 70956, "inner_six": 26117},
-    {"year": 2023, "score": 598, "total_city": 71211, "inner_six": 26176},
-    {"year": 2023, "score": 597, "total_city": 71439, "inner_six": 26223},
-    {"year": 2023, "score": 596, "total_city": 71688, "inner_six": 26291},
-    {"year": 2023, "score": 595, "total_city": 71897, "inner_six": 26342},
-    {"year": 2023, "score": 594, "total_city": 72131, "inner_six": 26390},
-    {"year": 2023, "score": 593, "total_city": 72336, "inner_six": 26447},
-    {"year": 2023, "score": 592, "total_city": 72587, "inner_six": 26505},
-    {"year": 2023, "score": 591, "total_city": 72807, "inner_six": 26553},
-    {"year": 2023, "score": 590, "total_city": 73044, "inner_six": 26613},
-    {"year": 2023, "score": 589, "total_city": 73272, "inner_six": 26667},
-    {"year": 2023, "score": 588, "total_city": 73504, "inner_six": 26721},
-    {"year": 2023, "score": 587, "total_city": 73751, "inner_six": 26776},
-    {"year": 2023, "score": 586, "total_city": 73970, "inner_six": 26825},
-    {"year": 2023, "score": 585, "total_city": 74179, "inner_six": 26867},
-    {"year": 2023, "score": 584, "total_city": 74394, "inner_six": 26927},
-    {"year": 2023, "score": 583, "total_city": 74622, "inner_six": 26976},
-    {"year": 2023, "score": 582, "total_city": 74838, "inner_six": 27032},
-    {"year": 2023, "score": 581, "total_city": 75040, "inner_six": 27080},
-    {"year": 2023, "score": 580, "total_city": 75268, "inner_six": 27144},
-    {"year": 2023, "score": 579, "total_city": 75472, "inner_six": 27192},
-    {"year": 2023, "score": 578, "total_city": 75670, "inner_six": 27237},
-    {"year": 2023, "score": 577, "total_city": 75864, "inner_six": 27284},
-    {"year": 2023, "score": 576, "total_city": 76054, "inner_six": 27323},
-    {"year": 2023, "score": 575, "total_city": 76253, "inner_six": 27370},
-    {"year": 2023, "score": 574, "total_city": 76450, "inner_six": 27406},
-    {"year": 2023, "score": 573, "total_city": 76655, "inner_six": 27446},
-    {"year": 2023, "score": 572, "total_city": 76842, "inner_six": 27485},
-    {"year": 2023, "score": 571, "total_city": 77048, "inner_six": 27536},
-    {"year": 2023, "score": 570, "total_city": 77246, "inner_six": 27584},
-    {"year": 2023, "score": 569, "total_city": 77433, "inner_six": 27625},
-    {"year": 2023, "score": 568, "total_city": 77632, "inner_six": 27666},
-    {"year": 2023, "score": 567, "total_city": 77833, "inner_six": 27716},
-    {"year": 2023, "score": 566, "total_city": 78014, "inner_six": 27752},
-    {"year": 2023, "score": 565, "total_city": 78199, "inner_six": 27798},
-    {"year": 2023, "score": 564, "total_city": 78380, "inner_six": 27835},
-    {"year": 2023, "score": 563, "total_city": 78574, "inner_six": 27879},
-    {"year": 2023, "score": 562, "total_city": 78754, "inner_six": 27920},
-    {"year": 2023, "score": 561, "total_city": 78958, "inner_six": 27959},
-    {"year": 2023, "score": 560, "total_city": 79120, "inner_six": 28003},
-    {"year": 2023, "score": 559, "total_city": 79291, "inner_six": 28045},
-    {"year": 2023, "score": 558, "total_city": 79454, "inner_six": 28083},
-    {"year": 2023, "score": 557, "total_city": 79630, "inner_six": 28120},
-    {"year": 2023, "score": 556, "total_city": 79819, "inner_six": 28170},
-    {"year": 2023, "score": 555, "total_city": 80005, "inner_six": 28213},
-    {"year": 2023, "score": 554, "total_city": 80169, "inner_six": 28264},
-    {"year": 2023, "score": 553, "total_city": 80366, "inner_six": 28304},
-    {"year": 2023, "score": 552, "total_city": 80553, "inner_six": 28342},
-    {"year": 2023, "score": 551, "total_city": 80740, "inner_six": 28382},
-    {"year": 2023, "score": 550, "total_city": 80903, "inner_six": 28419},
-    {"year": 2023, "score": 549, "total_city": 81083, "inner_six": 28451},
-    {"year": 2023, "score": 548, "total_city": 81250, "inner_six": 28494},
-    {"year": 2023, "score": 547, "total_city": 81418, "inner_six": 28533},
-    {"year": 2023, "score": 546, "total_city": 81592, "inner_six": 28566},
-    {"year": 2023, "score": 545, "total_city": 81742, "inner_six": 28600},
-    {"year": 2023, "score": 544, "total_city": 81915, "inner_six": 28643},
-    {"year": 2023, "score": 543, "total_city": 82062, "inner_six": 28673},
-    {"year": 2023, "score": 542, "total_city": 82224, "inner_six": 28718},
-    {"year": 2023, "score": 541, "total_city": 82381, "inner_six": 28755},
-    {"year": 2023, "score": 540, "total_city": 82534, "inner_six": 28797},
-    {"year": 2023, "score": 539, "total_city": 82697, "inner_six": 28840},
-    {"year": 2023, "score": 538, "total_city": 82897, "inner_six": 28883},
-    {"year": 2023, "score": 537, "total_city": 83064, "inner_six": 28929},
-    {"year": 2023, "score": 536, "total_city": 83223, "inner_six": 28968},
-    {"year": 2023, "score": 535, "total_city": 83396, "inner_six": 29009},
-    {"year": 2023, "score": 534, "total_city": 83554, "inner_six": 29043},
-    {"year": 2023, "score": 533, "total_city": 83732, "inner_six": 29082},
-    {"year": 2023, "score": 532, "total_city": 83882, "inner_six": 29121},
-    {"year": 2023, "score": 531, "total_city": 84033, "inner_six": 29159},
-    {"year": 2023, "score": 530, "total_city": 84198, "inner_six": 29202},
-    {"year": 2023, "score": 529, "total_city": 84348, "inner_six": 29235},
-    {"year": 2023, "score": 528, "total_city": 84506, "inner_six": 29270},
-    {"year": 2023, "score": 527, "total_city": 84634, "inner_six": 29298},
-    {"year": 2023, "score": 526, "total_city": 84799, "inner_six": 29337},
-    {"year": 2023, "score": 525, "total_city": 84945, "inner_six": 29369},
-    {"year": 2023, "score": 524, "total_city": 85086, "inner_six": 29400},
-    {"year": 2023, "score": 523, "total_city": 85229, "inner_six": 29426},
-    {"year": 2023, "score": 522, "total_city": 85388, "inner_six": 29459},
-    {"year": 2023, "score": 521, "total_city": 85564, "inner_six": 29499},
-    {"year": 2023, "score": 520, "total_city": 85727, "inner_six": 29531},
-    {"year": 2023, "score": 519, "total_city": 85873, "inner_six": 29566},
-    {"year": 2023, "score": 518, "total_city": 86008, "inner_six": 29590},
-    {"year": 2023, "score": 517, "total_city": 86159, "inner_six": 29621},
-    {"year": 2023, "score": 516, "total_city": 86317, "inner_six": 29658},
-    {"year": 2023, "score": 515, "total_city": 86458, "inner_six": 29693},
-    {"year": 2023, "score": 514, "total_city": 86595, "inner_six": 29719},
-    {"year": 2023, "score": 513, "total_city": 86728, "inner_six": 29754},
-    {"year": 2023, "score": 512, "total_city": 86869, "inner_six": 29790},
-    {"year": 2023, "score": 511, "total_city": 87006, "inner_six": 29827},
-    {"year": 2023, "score": 510, "total_city": 87160, "inner_six": 29864},
-    {"year": 2023, "score": 509, "total_city": 87282, "inner_six": 29898},
-    {"year": 2023, "score": 508, "total_city": 87435, "inner_six": 29933},
-    {"year": 2023, "score": 507, "total_city": 87595, "inner_six": 29956},
-    {"year": 2023, "score": 506, "total_city": 87753, "inner_six": 29989},
-    {"year": 2023, "score": 505, "total_city": 87886, "inner_six": 30027},
-    {"year": 2023, "score": 504, "total_city": 88045, "inner_six": 30064},
-    {"year": 2023, "score": 503, "total_city": 88184, "inner_six": 30086},
-    {"year": 2023, "score": 502, "total_city": 88343, "inner_six": 30112},
-    {"year": 2023, "score": 501, "total_city": 88507, "inner_six": 30147},
-    {"year": 2023, "score": 500, "total_city": 88639, "inner_six": 30179},
-    {"year": 2024, "score": 780, "total_city": 311, "inner_six": 233},
-    {"year": 2024, "score": 779, "total_city": 382, "inner_six": 285},
-    {"year": 2024, "score": 778, "total_city": 499, "inner_six": 374},
-    {"year": 2024, "score": 777, "total_city": 603, "inner_six": 450},
-    {"year": 2024, "score": 776, "total_city": 740, "inner_six": 553},
-    {"year": 2024, "score": 775, "total_city": 888, "inner_six": 659},
-    {"year": 2024, "score": 774, "total_city": 1079, "inner_six": 801},
-    {"year": 2024, "score": 773, "total_city": 1283, "inner_six": 942},
-    {"year": 2024, "score": 772, "total_city": 1521, "inner_six": 1117},
-    {"year": 2024, "score": 771, "total_city": 1789, "inner_six": 1299},
-    {"year": 2024, "score": 770, "total_city": 2039, "inner_six": 1467},
-    {"year": 2024, "score": 769, "total_city": 2320, "inner_six": 1674},
-    {"year": 2024, "score": 768, "total_city": 2620, "inner_six": 1872},
-    {"year": 2024, "score": 767, "total_city": 2965, "inner_six": 2102},
-    {"year": 2024, "score": 766, "total_city": 3285, "inner_six": 2301},
-    {"year": 2024, "score": 765, "total_city": 3638, "inner_six": 2533},
-    {"year": 2024, "score": 764, "total_city": 4057, "inner_six": 2800},
-    {"year": 2024, "score": 763, "total_city": 4481, "inner_six": 3077},
-    {"year": 2024, "score": 762, "total_city": 4917, "inner_six": 3348},
-    {"year": 2024, "score": 761, "total_city": 5391, "inner_six": 3629},
-    {"year": 2024, "score": 760, "total_city": 5863, "inner_six": 3927},
-    {"year": 2024, "score": 759, "total_city": 6341, "inner_six": 4186},
-    {"year": 2024, "score": 758, "total_city": 6821, "inner_six": 4455},
-    {"year": 2024, "score": 757, "total_city": 7296, "inner_six": 4732},
-    {"year": 2024, "score": 756, "total_city": 7843, "inner_six": 5036},
-    {"year": 2024, "score": 755, "total_city": 8354, "inner_six": 5331},
-    {"year": 2024, "score": 754, "total_city": 8925, "inner_six": 5638},
-    {"year": 2024, "score": 753, "total_city": 9492, "inner_six": 5924},
-    {"year": 2024, "score": 752, "total_city": 10076, "inner_six": 6242},
-    {"year": 2024, "score": 751, "total_city": 10674, "inner_six": 6572},
-    {"year": 2024, "score": 750, "total_city": 11243, "inner_six": 6871},
-    {"year": 2024, "score": 749, "total_city": 11869, "inner_six": 7192},
-    {"year": 2024, "score": 748, "total_city": 12495, "inner_six": 7531},
-    {"year": 2024, "score": 747, "total_city": 13112, "inner_six": 7841},
-    {"year": 2024, "score": 746, "total_city": 13690, "inner_six": 8113},
-    {"year": 2024, "score": 745, "total_city": 14277, "inner_six": 8425},
-    {"year": 2024, "score": 744, "total_city": 14913, "inner_six": 8690},
-    {"year": 2024, "score": 743, "total_city": 15612, "inner_six": 9033},
-    {"year": 2024, "score": 742, "total_city": 16243, "inner_six": 9321},
-    {"year": 2024, "score": 741, "total_city": 16884, "inner_six": 9623},
-    {"year": 2024, "score": 740, "total_city": 17508, "inner_six": 9897},
-    {"year": 2024, "score": 739, "total_city": 18130, "inner_six": 10166},
-    {"year": 2024, "score": 738, "total_city": 18797, "inner_six": 10442},
-    {"year": 2024, "score": 737, "total_city": 19454, "inner_six": 10731},
-    {"year": 2024, "score": 736, "total_city": 20112, "inner_six": 11004},
-    {"year": 2024, "score": 735, "total_city": 20718, "inner_six": 11277},
-    {"year": 2024, "score": 734, "total_city": 21311, "inner_six": 11530},
-    {"year": 2024, "score": 733, "total_city": 21907, "inner_six": 11774},
-    {"year": 2024, "score": 732, "total_city": 22524, "inner_six": 12038},
-    {"year": 2024, "score": 731, "total_city": 23166, "inner_six": 12304},
-    {"year": 2024, "score": 730, "total_city": 23777, "inner_six": 12569},
-    {"year": 2024, "score": 729, "total_city": 24373, "inner_six": 12821},
-    {"year": 2024, "score": 728, "total_city": 24990, "inner_six": 13106},
-    {"year": 2024, "score": 727, "total_city": 25607, "inner_six": 13330},
-    {"year": 2024, "score": 726, "total_city": 26226, "inner_six": 13583},
-    {"year": 2024, "score": 725, "total_city": 26838, "inner_six": 13832},
-    {"year": 2024, "score": 724, "total_city": 27435, "inner_six": 14075},
-    {"year": 2024, "score": 723, "total_city": 28029, "inner_six": 14301},
-    {"year": 2024, "score": 722, "total_city": 28651, "inner_six": 14527},
-    {"year": 2024, "score": 721, "total_city": 29220, "inner_six": 14727},
-    {"year": 2024, "score": 720, "total_city": 29813, "inner_six": 14962},
-    {"year": 2024, "score": 719, "total_city": 30390, "inner_six": 15195},
-    {"year": 2024, "score": 718, "total_city": 30949, "inner_six": 15411},
-    {"year": 2024, "score": 717, "total_city": 31549, "inner_six": 15629},
-    {"year": 2024, "score": 716, "total_city": 32112, "inner_six": 15868},
-    {"year": 2024, "score": 715, "total_city": 32701, "inner_six": 16093},
-    {"year": 2024, "score": 714, "total_city": 33316, "inner_six": 16309},
-    {"year": 2024, "score": 713, "total_city": 33872, "inner_six": 16524},
-    {"year": 2024, "score": 712, "total_city": 34431, "inner_six": 16739},
-    {"year": 2024, "score": 711, "total_city": 35016, "inner_six": 16947},
-    {"year": 2024, "score": 710, "total_city": 35575, "inner_six": 17156},
-    {"year": 2024, "score": 709, "total_city": 36143, "inner_six": 17360},
-    {"year": 2024, "score": 708, "total_city": 36725, "inner_six": 17579},
-    {"year": 2024, "score": 707, "total_city": 37271, "inner_six": 17765},
-    {"year": 2024, "score": 706, "total_city": 37824, "inner_six": 17967},
-    {"year": 2024, "score": 705, "total_city": 38389, "inner_six": 18153},
-    {"year": 2024, "score": 704, "total_city": 38952, "inner_six": 18356},
-    {"year": 2024, "score": 703, "total_city": 39501, "inner_six": 18535},
-    {"year": 2024, "score": 702, "total_city": 40024, "inner_six": 18705},
-    {"year": 2024, "score": 701, "total_city": 40547, "inner_six": 18886},
-    {"year": 2024, "score": 700, "total_city": 41082, "inner_six": 19079},
-    {"year": 2024, "score": 699, "total_city": 41570, "inner_six": 19254},
-    {"year": 2024, "score": 698, "total_city": 42132, "inner_six": 19460},
-    {"year": 2024, "score": 697, "total_city": 42668, "inner_six": 19646},
-    {"year": 2024, "score": 696, "total_city": 43170, "inner_six": 19814},
-    {"year": 2024, "score": 695, "total_city": 43659, "inner_six": 19991},
-    {"year": 2024, "score": 694, "total_city": 44170, "inner_six": 20160},
-    {"year": 2024, "score": 693, "total_city": 44664, "inner_six": 20313},
-    {"year": 2024, "score": 692, "total_city": 45147, "inner_six": 20471},
-    {"year": 2024, "score": 691, "total_city": 45639, "inner_six": 20619},
-    {"year": 2024, "score": 690, "total_city": 46136, "inner_six": 20785},
-    {"year": 2024, "score": 689, "total_city": 46625, "inner_six": 20942},
-    {"year": 2024, "score": 688, "total_city": 47072, "inner_six": 21104},
-    {"year": 2024, "score": 687, "total_city": 47566, "inner_six": 21252},
-    {"year": 2024, "score": 686, "total_city": 48004, "inner_six": 21388},
-    {"year": 2024, "score": 685, "total_city": 48490, "inner_six": 21556},
-    {"year": 2024, "score": 684, "total_city": 48981, "inner_six": 21719},
-    {"year": 2024, "score": 683, "total_city": 49447, "inner_six": 21863},
-    {"year": 2024, "score": 682, "total_city": 49925, "inner_six": 22027},
-    {"year": 2024, "score": 681, "total_city": 50386, "inner_six": 22163},
-    {"year": 2024, "score": 680, "total_city": 50825, "inner_six": 22301},
-    {"year": 2024, "score": 679, "total_city": 51272, "inner_six": 22440},
-    {"year": 2024, "score": 678, "total_city": 51738, "inner_six": 22602},
-    {"year": 2024, "score": 677, "total_city": 52177, "inner_six": 22761},
-    {"year": 2024, "score": 676, "total_city": 52642, "inner_six": 22917},
-    {"year": 2024, "score": 675, "total_city": 53082, "inner_six": 23048},
-    {"year": 2024, "score": 674, "total_city": 53512, "inner_six": 23185},
-    {"year": 2024, "score": 673, "total_city": 53958, "inner_six": 23335},
-    {"year": 2024, "score": 672, "total_city": 54363, "inner_six": 23445},
-    {"year": 2024, "score": 671, "total_city": 54816, "inner_six": 23583},
-    {"year": 2024, "score": 670, "total_city": 55220, "inner_six": 23716},
-    {"year": 2024, "score": 669, "total_city": 55659, "inner_six": 23837},
-    {"year": 2024, "score": 668, "total_city": 56053, "inner_six": 23949},
-    {"year": 2024, "score": 667, "total_city": 56512, "inner_six": 24082},
-    {"year": 2024, "score": 666, "total_city": 56940, "inner_six": 24205},
-    {"year": 2024, "score": 665, "total_city": 57336, "inner_six": 24312},
-    {"year": 2024, "score": 664, "total_city": 57723, "inner_six": 24428},
-    {"year": 2024, "score": 663, "total_city": 58143, "inner_six": 24558},
-    {"year": 2024, "score": 662, "total_city": 58528, "inner_six": 24669},
-    {"year": 2024, "score": 661, "total_city": 58919, "inner_six": 24780},
-    {"year": 2024, "score": 660, "total_city": 59304, "inner_six": 24895},
-    {"year": 2024, "score": 659, "total_city": 59682, "inner_six": 24997},
-    {"year": 2024, "score": 658, "total_city": 60073, "inner_six": 25109},
-    {"year": 2024, "score": 657, "total_city": 60443, "inner_six": 25223},
-    {"year": 2024, "score": 656, "total_city": 60807, "inner_six": 25316},
-    {"year": 2024, "score": 655, "total_city": 61165, "inner_six": 25397},
-    {"year": 2024, "score": 654, "total_city": 61506, "inner_six": 25499},
-    {"year": 2024, "score": 653, "total_city": 61878, "inner_six": 25587},
-    {"year": 2024, "score": 652, "total_city": 62232, "inner_six": 25680},
-    {"year": 2024, "score": 651, "total_city": 62609, "inner_six": 25790},
-    {"year": 2024, "score": 650, "total_city": 62973, "inner_six": 25892},
-    {"year": 2024, "score": 649, "total_city": 63351, "inner_six": 25984},
-    {"year": 2024, "score": 648, "total_city": 63707, "inner_six": 26096},
-    {"year": 2024, "score": 647, "total_city": 64076, "inner_six": 26183},
-    {"year": 2024, "score": 646, "total_city": 64427, "inner_six": 26273},
-    {"year": 2024, "score": 645, "total_city": 64801, "inner_six": 26379},
-    {"year": 2024, "score": 644, "total_city": 65153, "inner_six": 26475},
-    {"year": 2024, "score": 643, "total_city": 65508, "inner_six": 26577},
-    {"year": 2024, "score": 642, "total_city": 65857, "inner_six": 26678},
-    {"year": 2024, "score": 641, "total_city": 66223, "inner_six": 26794},
-    {"year": 2024, "score": 640, "total_city": 66563, "inner_six": 26886},
-    {"year": 2024, "score": 639, "total_city": 66897, "inner_six": 26966},
-    {"year": 2024, "score": 638, "total_city": 67244, "inner_six": 27055},
-    {"year": 2024, "score": 637, "total_city": 67552, "inner_six": 27133},
-    {"year": 2024, "score": 636, "total_city": 67888, "inner_six": 27221},
-    {"year": 2024, "score": 635, "total_city": 68210, "inner_six": 27299},
-    {"year": 2024, "score": 634, "total_city": 68538, "inner_six": 27387},
-    {"year": 2024, "score": 633, "total_city": 68862, "inner_six": 27468},
-    {"year": 2024, "score": 632, "total_city": 69163, "inner_six": 27542},
-    {"year": 2024, "score": 631, "total_city": 69510, "inner_six": 27620},
-    {"year": 2024, "score": 630, "total_city": 69820, "inner_six": 27700},
-    {"year": 2024, "score": 629, "total_city": 70148, "inner_six": 27785},
-    {"year": 2024, "score": 628, "total_city": 70436, "inner_six": 27860},
-    {"year": 2024, "score": 627, "total_city": 70747, "inner_six": 27935},
-    {"year": 2024, "score": 626, "total_city": 71060, "inner_six": 28011},
-    {"year": 2024, "score": 625, "total_city": 71367, "inner_six": 28091},
-    {"year": 2024, "score": 624, "total_city": 71656, "inner_six": 28162},
-    {"year": 2024, "score": 623, "total_city": 71923, "inner_six": 28221},
-    {"year": 2024, "score": 622, "total_city": 72231, "inner_six": 28304},
-    {"year": 2024, "score": 621, "total_city": 72527, "inner_six": 28382},
-    {"year": 2024, "score": 620, "total_city": 72790, "inner_six": 28437},
-    {"year": 2024, "score": 619, "total_city": 73061, "inner_six": 28496},
-    {"year": 2024, "score": 618, "total_city": 73361, "inner_six": 28574},
-    {"year": 2024, "score": 617, "total_city": 73647, "inner_six": 28646},
-    {"year": 2024, "score": 616, "total_city": 73911, "inner_six": 28701},
-    {"year": 2024, "score": 615, "total_city": 74182, "inner_six": 28755},
-    {"year": 2024, "score": 614, "total_city": 74459, "inner_six": 28825},
-    {"year": 2024, "score": 613, "total_city": 74740, "inner_six": 28891},
-    {"year": 2024, "score": 612, "total_city": 75023, "inner_six": 28958},
-    {"year": 2024, "score": 611, "total_city": 75287, "inner_six": 29022},
-    {"year": 2024, "score": 610, "total_city": 75537, "inner_six": 29088},
-    {"year": 2024, "score": 609, "total_city": 75760, "inner_six": 29137},
-    {"year": 2024, "score": 608, "total_city": 76021, "inner_six": 29201},
-    {"year": 2024, "score": 607, "total_city": 76290, "inner_six": 29282},
-    {"year": 2024, "score": 606, "total_city": 76558, "inner_six": 29344},
-    {"year": 2024, "score": 605, "total_city": 76820, "inner_six": 29404},
-    {"year": 2024, "score": 604, "total_city": 77071, "inner_six": 29455},
-    {"year": 2024, "score": 603, "total_city": 77330, "inner_six": 29526},
-    {"year": 2024, "score": 602, "total_city": 77591, "inner_six": 29584},
-    {"year": 2024, "score": 601, "total_city": 77850, "inner_six": 29647},
-    {"year": 2024, "score": 600, "total_city": 78097, "inner_six": 29702},
-    {"year": 2024, "score": 599, "total_city": 78316, "inner_six": 29749},
-    {"year": 2024, "score": 598, "total_city": 78521, "inner_six": 29812},
-    {"year": 2024, "score": 597, "total_city": 78782, "inner_six": 29860},
-    {"year": 2024, "score": 596, "total_city": 79005, "inner_six": 29921},
-    {"year": 2024, "score": 595, "total_city": 79255, "inner_six": 29978},
-    {"year": 2024, "score": 594, "total_city": 79507, "inner_six": 30047},
-    {"year": 2024, "score": 593, "total_city": 79738, "inner_six": 30105},
-    {"year": 2024, "score": 592, "total_city": 79943, "inner_six": 30156},
-    {"year": 2024, "score": 591, "total_city": 80184, "inner_six": 30207},
-    {"year": 2024, "score": 590, "total_city": 80438, "inner_six": 30266},
-    {"year": 2024, "score": 589, "total_city": 80665, "inner_six": 30332},
-    {"year": 2024, "score": 588, "total_city": 80879, "inner_six": 30373},
-    {"year": 2024, "score": 587, "total_city": 81124, "inner_six": 30437},
-    {"year": 2024, "score": 586, "total_city": 81329, "inner_six": 30479},
-    {"year": 2024, "score": 585, "total_city": 81543, "inner_six": 30532},
-    {"year": 2024, "score": 584, "total_city": 81761, "inner_six": 30592},
-    {"year": 2024, "score": 583, "total_city": 81962, "inner_six": 30642},
-    {"year": 2024, "score": 582, "total_city": 82178, "inner_six": 30700},
-    {"year": 2024, "score": 581, "total_city": 82374, "inner_six": 30745},
-    {"year": 2024, "score": 580, "total_city": 82597, "inner_six": 30802},
-    {"year": 2024, "score": 579, "total_city": 82802, "inner_six": 30848},
-    {"year": 2024, "score": 578, "total_city": 83002, "inner_six": 30900},
-    {"year": 2024, "score": 577, "total_city": 83201, "inner_six": 30944},
-    {"year": 2024, "score": 576, "total_city": 83406, "inner_six": 30990},
-    {"year": 2024, "score": 575, "total_city": 83638, "inner_six": 31053},
-    {"year": 2024, "score": 574, "total_city": 83846, "inner_six": 31104},
-    {"year": 2024, "score": 573, "total_city": 84037, "inner_six": 31141},
-    {"year": 2024, "score": 572, "total_city": 84241, "inner_six": 31190},
-    {"year": 2024, "score": 571, "total_city": 84445, "inner_six": 31231},
-    {"year": 2024, "score": 570, "total_city": 84612, "inner_six": 31279},
-    {"year": 2024, "score": 569, "total_city": 84804, "inner_six": 31332},
-    {"year": 2024, "score": 568, "total_city": 84964, "inner_six": 31365},
-    {"year": 2024, "score": 567, "total_city": 85139, "inner_six": 31394},
-    {"year": 2024, "score": 566, "total_city": 85352, "inner_six": 31446},
-    {"year": 2024, "score": 565, "total_city": 85538, "inner_six": 31496},
-    {"year": 2024, "score": 564, "total_city": 85718, "inner_six": 31535},
-    {"year": 2024, "score": 563, "total_city": 85910, "inner_six": 31586},
-    {"year": 2024, "score": 562, "total_city": 86104, "inner_six": 31633},
-    {"year": 2024, "score": 561, "total_city": 86282, "inner_six": 31678},
-    {"year": 2024, "score": 560, "total_city": 86464, "inner_six": 31716},
-    {"year": 2024, "score": 559, "total_city": 86649, "inner_six": 31757},
-    {"year": 2024, "score": 558, "total_city": 86823, "inner_six": 31804},
-    {"year": 2024, "score": 557, "total_city": 86991, "inner_six": 31848},
-    {"year": 2024, "score": 556, "total_city": 87171, "inner_six": 31891},
-    {"year": 2024, "score": 555, "total_city": 87360, "inner_six": 31943},
-    {"year": 2024, "score": 554, "total_city": 87523, "inner_six": 31984},
-    {"year": 2024, "score": 553, "total_city": 87700, "inner_six": 32016},
-    {"year": 2024, "score": 552, "total_city": 87858, "inner_six": 32050},
-    {"year": 2024, "score": 551, "total_city": 88014, "inner_six": 32092},
-    {"year": 2024, "score": 550, "total_city": 88187, "inner_six": 32131},
-    {"year": 2024, "score": 549, "total_city": 88337, "inner_six": 32163},
-    {"year": 2024, "score": 548, "total_city": 88507, "inner_six": 32195},
-    {"year": 2024, "score": 547, "total_city": 88665, "inner_six": 32233},
-    {"year": 2024, "score": 546, "total_city": 88846, "inner_six": 32285},
-    {"year": 2024, "score": 545, "total_city": 89007, "inner_six": 32319},
-    {"year": 2024, "score": 544, "total_city": 89163, "inner_six": 32360},
-    {"year": 2024, "score": 543, "total_city": 89331, "inner_six": 32400},
-    {"year": 2024, "score": 542, "total_city": 89477, "inner_six": 32433},
-    {"year": 2024, "score": 541, "total_city": 89625, "inner_six": 32468},
-    {"year": 2024, "score": 540, "total_city": 89785, "inner_six": 32508},
-    {"year": 2024, "score": 539, "total_city": 89948, "inner_six": 32555},
-    {"year": 2024, "score": 538, "total_city": 90090, "inner_six": 32581},
-    {"year": 2024, "score": 537, "total_city": 90250, "inner_six": 32616},
-    {"year": 2024, "score": 536, "total_city": 90411, "inner_six": 32660},
-    {"year": 2024, "score": 535, "total_city": 90560, "inner_six": 32689},
-    {"year": 2024, "score": 534, "total_city": 90712, "inner_six": 32723},
-    {"year": 2024, "score": 533, "total_city": 90866, "inner_six": 32762},
-    {"year": 2024, "score": 532, "total_city": 91013, "inner_six": 32796},
-    {"year": 2024, "score": 531, "total_city": 91161, "inner_six": 32833},
-    {"year": 2024, "score": 530, "total_city": 91303, "inner_six": 32864},
-    {"year": 2024, "score": 529, "total_city": 91449, "inner_six": 32893},
-    {"year": 2024, "score": 528, "total_city": 91603, "inner_six": 32929},
-    {"year": 2024, "score": 527, "total_city": 91753, "inner_six": 32960},
-    {"year": 2024, "score": 526, "total_city": 91912, "inner_six": 32999},
-    {"year": 2024, "score": 525, "total_city": 92060, "inner_six": 33032},
-    {"year": 2024, "score": 524, "total_city": 92225, "inner_six": 33075},
-    {"year": 2024, "score": 523, "total_city": 92374, "inner_six": 33114},
-    {"year": 2024, "score": 522, "total_city": 92513, "inner_six": 33149},
-    {"year": 2024, "score": 521, "total_city": 92650, "inner_six": 33181},
-    {"year": 2024, "score": 520, "total_city": 92796, "inner_six": 33210},
-    {"year": 2024, "score": 519, "total_city": 92938, "inner_six": 33244},
-    {"year": 2024, "score": 518, "total_city": 93061, "inner_six": 33273},
-    {"year": 2024, "score": 517, "total_city": 93202, "inner_six": 33306},
-    {"year": 2024, "score": 516, "total_city": 93339, "inner_six": 33329},
-    {"year": 2024, "score": 515, "total_city": 93468, "inner_six": 33356},
-    {"year": 2024, "score": 514, "total_city": 93601, "inner_six": 33381},
-    {"year": 2024, "score": 513, "total_city": 93740, "inner_six": 33422},
-    {"year": 2024, "score": 512, "total_city": 93884, "inner_six": 33453},
-    {"year": 2024, "score": 511, "total_city": 94048, "inner_six": 33499},
-    {"year": 2024, "score": 510, "total_city": 94162, "inner_six": 33523},
-    {"year": 2024, "score": 509, "total_city": 94291, "inner_six": 33558},
-    {"year": 2024, "score": 508, "total_city": 94430, "inner_six": 33590},
-    {"year": 2024, "score": 507, "total_city": 94566, "inner_six": 33623},
-    {"year": 2024, "score": 506, "total_city": 94704, "inner_six": 33658},
-    {"year": 2024, "score": 505, "total_city": 94856, "inner_six": 33691},
-    {"year": 2024, "score": 504, "total_city": 94990, "inner_six": 33721},
-    {"year": 2024, "score": 503, "total_city": 95141, "inner_six": 33764},
-    {"year": 2024, "score": 502, "total_city": 95297, "inner_six": 33801},
-    {"year": 2024, "score": 501, "total_city": 95417, "inner_six": 33829},
-    {"year": 2024, "score": 500, "total_city": 95543, "inner_six": 33854},
-]
@@ -19,10 +19,14 @@ class BaseAPIException(Exception):
         self.status_code = status_code
         self.error_code = error_code or self.__class__.__name__
         self.details = details or {}
+        self._dict = None
         super().__init__(self.message)
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为响应字典"""
+        """转换为响应字典（首次调用时构建并缓存）"""
+        if self._dict is not None:
+            return self._dict
+        
         result = {
             "error": self.error_code,
             "message": self.message,
@@ -30,6 +34,7 @@ class BaseAPIException(Exception):
         }
         if self.details:
             result["details"] = self.details
+        self._dict = result
         return result
 
 
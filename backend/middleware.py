@@ -3,13 +3,15 @@
 处理请求日志、性能监控、错误恢复等
 """
 import time
-import uuid
+import asyncio
+import secrets
 import logging
-from typing import Callable
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, Optional
 from contextvars import ContextVar
 
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from exceptions import BaseAPIException
@@ -21,13 +23,49 @@ logger = logging.getLogger(__name__)
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 
 
+def get_client_host(request: Request) -> str:
+    """获取客户端地址，结果缓存在 request.state.client_ip 中供后续中间件和处理函数复用"""
+    host = getattr(request.state, "client_ip", None)
+    if host is None:
+        host = request.client.host if request.client else "unknown"
+        request.state.client_ip = host
+    return host
+
+
+class RequestContextMiddleware:
+    """请求上下文中间件（纯ASGI实现）
+
+    在 request.state 中记录请求开始时间（time.perf_counter）、客户端IP和
+    User-Agent，处理函数的成功和错误路径直接读取，无需重复获取。
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            user_agent = "unknown"
+            for name, value in scope["headers"]:
+                if name == b"user-agent":
+                    user_agent = value.decode("latin-1")
+                    break
+            client = scope.get("client")
+            state = scope.setdefault("state", {})
+            state["start_time"] = time.perf_counter()
+            state["client_ip"] = client[0] if client else "unknown"
+            state["user_agent"] = user_agent
+        await self.app(scope, receive, send)
+
+
 class RequestIDMiddleware(BaseHTTPMiddleware):
     """请求ID中间件"""
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # 生成或获取请求ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        # 获取或生成请求ID（客户端已提供时不再生成）
+        request_id = request.headers.get("X-Request-ID") or secrets.token_hex(8)
         request_id_var.set(request_id)
+        request.state.request_id = request_id
+        get_client_host(request)
         
         # 处理请求
         response = await call_next(request)
@@ -39,54 +77,65 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
-    """请求日志中间件"""
+    """请求日志与性能监控中间件"""
+    
+    def __init__(self, app, slow_request_threshold: float = 1.0):
+        super().__init__(app)
+        self.slow_request_threshold = slow_request_threshold  # 秒
+        self._slow_threshold_ns = int(slow_request_threshold * 1e9)
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # 记录请求开始
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         request_id = request_id_var.get()
         
-        # 日志请求信息
-        logger.info(
-            f"Request started - ID: {request_id}, "
-            f"Method: {request.method}, "
-            f"Path: {request.url.path}, "
-            f"Client: {request.client.host if request.client else 'unknown'}"
-        )
+        # 日志请求信息（INFO未启用时跳过格式化）
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request started - ID: %s, Method: %s, Path: %s, Client: %s",
+                request_id, request.method, request.url.path,
+                get_client_host(request)
+            )
         
         try:
             # 处理请求
             response = await call_next(request)
             
-            # 计算处理时间
-            process_time = (time.time() - start_time) * 1000  # 毫秒
-            
-            # 日志响应信息
-            logger.info(
-                f"Request completed - ID: {request_id}, "
-                f"Status: {response.status_code}, "
-                f"Time: {process_time:.2f}ms"
-            )
-            
-            # 添加处理时间到响应头
-            response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
-            
-            return response
-            
         except Exception as e:
             # 计算处理时间
-            process_time = (time.time() - start_time) * 1000
+            process_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             # 日志错误信息
             logger.error(
-                f"Request failed - ID: {request_id}, "
-                f"Error: {str(e)}, "
-                f"Time: {process_time:.2f}ms",
+                "Request failed - ID: %s, Error: %s, Time: %.2fms",
+                request_id, e, process_time,
                 exc_info=True
             )
             
             # 重新抛出异常
             raise
+        
+        # 计算处理时间
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        process_time = elapsed_ns / 1e6  # 毫秒
+        
+        # 日志响应信息
+        logger.info(
+            "Request completed - ID: %s, Status: %d, Time: %.2fms",
+            request_id, response.status_code, process_time
+        )
+        
+        # 如果请求处理时间过长，记录警告
+        if elapsed_ns > self._slow_threshold_ns:
+            logger.warning(
+                "Slow request detected - ID: %s, Path: %s, Time: %.2fs",
+                request_id, request.url.path, elapsed_ns / 1e9
+            )
+        
+        # 添加处理时间到响应头
+        response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
+        
+        return response
 
 
 class ErrorHandlingMiddleware(BaseHTTPMiddleware):
@@ -97,7 +146,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         except BaseAPIException as e:
             # 处理自定义API异常
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=e.status_code,
                 content=e.to_dict()
             )
@@ -109,7 +158,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                 exc_info=True
             )
             
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "error": "INTERNAL_SERVER_ERROR",
@@ -119,34 +168,6 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             )
 
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    """性能监控中间件"""
-    
-    def __init__(self, app, slow_request_threshold: float = 1.0):
-        super().__init__(app)
-        self.slow_request_threshold = slow_request_threshold  # 秒
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
-        # 处理请求
-        response = await call_next(request)
-        
-        # 计算处理时间
-        process_time = time.time() - start_time
-        
-        # 如果请求处理时间过长，记录警告
-        if process_time > self.slow_request_threshold:
-            request_id = request_id_var.get()
-            logger.warning(
-                f"Slow request detected - ID: {request_id}, "
-                f"Path: {request.url.path}, "
-                f"Time: {process_time:.2f}s"
-            )
-        
-        return response
-
-
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """简单的速率限制中间件"""
     
@@ -154,46 +175,60 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.rate_limit = rate_limit  # 请求数
         self.window = window  # 时间窗口（秒）
-        self.requests = {}  # 存储请求记录
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)  # 每个客户端按时间顺序的请求时间
+        self._sweeper_task: Optional[asyncio.Task] = None
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # 后台清理任务在首个请求时于当前事件循环中启动
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweeper())
+        
         # 获取客户端标识
-        client_id = request.client.host if request.client else "unknown"
+        client_id = get_client_host(request)
         
-        # 清理过期记录
-        current_time = time.time()
-        self.requests = {
-            k: [t for t in v if current_time - t < self.window]
-            for k, v in self.requests.items()
-            if len([t for t in v if current_time - t < self.window]) > 0
-        }
+        # 只清理当前客户端的过期记录（时间有序，从左侧弹出即可）
+        current_time = time.monotonic()
+        timestamps = self.requests[client_id]
+        while timestamps and timestamps[0] <= current_time - self.window:
+            timestamps.popleft()
         
         # 检查速率限制
-        if client_id in self.requests:
-            if len(self.requests[client_id]) >= self.rate_limit:
-                logger.warning(f"Rate limit exceeded for client: {client_id}")
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "error": "RATE_LIMIT_EXCEEDED",
-                        "message": f"请求过于频繁，请稍后再试。限制：{self.rate_limit}次/{self.window}秒"
-                    }
-                )
+        if len(timestamps) >= self.rate_limit:
+            logger.warning("Rate limit exceeded for client: %s", client_id)
+            return ORJSONResponse(
+                status_code=429,
+                content={
+                    "error": "RATE_LIMIT_EXCEEDED",
+                    "message": f"请求过于频繁，请稍后再试。限制：{self.rate_limit}次/{self.window}秒"
+                }
+            )
         
         # 记录请求
-        if client_id not in self.requests:
-            self.requests[client_id] = []
-        self.requests[client_id].append(current_time)
+        timestamps.append(current_time)
         
         # 处理请求
         return await call_next(request)
+    
+    async def _sweeper(self):
+        """后台任务：每个时间窗口移除一次没有有效记录的客户端，限制字典大小"""
+        while True:
+            await asyncio.sleep(self.window)
+            self._sweep(time.monotonic() - self.window)
+    
+    def _sweep(self, expire_before: float):
+        """移除所有记录均已过期的客户端"""
+        expired = [
+            client_id for client_id, timestamps in self.requests.items()
+            if not timestamps or timestamps[-1] <= expire_before
+        ]
+        for client_id in expired:
+            del self.requests[client_id]
 
 
 def setup_middleware(app):
     """配置所有中间件"""
     # 注意：中间件的添加顺序很重要，最后添加的最先执行
-    app.add_middleware(PerformanceMiddleware, slow_request_threshold=1.0)
     app.add_middleware(ErrorHandlingMiddleware)
-    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(LoggingMiddleware, slow_request_threshold=1.0)  # 同时负责慢请求告警
     app.add_middleware(RequestIDMiddleware)
     # app.add_middleware(RateLimitMiddleware, rate_limit=100, window=60)  # 可选
\ No newline at end of file
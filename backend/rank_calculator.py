@@ -5,13 +5,20 @@
 同时支持全市排名和市六区排名
 """
 
+import logging
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Any
 from data import get_data_by_year
 
+logger = logging.getLogger(__name__)
 
 # 数据库连接函数已被移除，现在直接使用静态数据
 
+# 分数上限（以0.01分为单位），用于预计算排名表
+MAX_SCORE_X100 = 800 * 100
+
 
 class ImprovedRankCalculator:
     """改进版排名计算器，使用更精确的线性插值，支持全市和市六区排名"""
@@ -21,23 +28,32 @@ class ImprovedRankCalculator:
         self.score_rank_map_city = {}     # 分数到全市排名的映射
         self.score_rank_map_inner = {}    # 分数到市六区排名的映射
         self.sorted_scores = []           # 排序后的分数列表
+        self._asc_scores = []             # 升序分数列表（用于二分查找相邻分数）
         self.total_students_city = 0      # 全市总学生数
         self.total_students_inner = 0     # 市六区总学生数
+        self.city_rank_table = None       # 分数×100 → 全市排名 的预计算表（int32）
+        self.inner_rank_table = None      # 分数×100 → 市六区排名 的预计算表（int32）
+        self._xp_city = self._fp_city = None    # 全市插值节点（分数升序, 对应排名）
+        self._xp_inner = self._fp_inner = None  # 市六区插值节点（分数升序, 对应排名）
         self._load_data()
+        self._build_rank_tables()
     
     def _load_data(self):
         """从静态数据加载数据"""
-        print(f"🔍 [DEBUG] _load_data 开始加载数据，年份: {self.year}")
+        logger.debug("_load_data 开始加载数据，年份: %s", self.year)
         
         # 从静态数据获取指定年份的数据
         year_data = get_data_by_year(self.year)
-        print(f"🔍 [DEBUG] 获取到 {len(year_data)} 条记录")
+        logger.debug("获取到 %d 条记录", len(year_data))
         
         if not year_data:
-            print(f"❌ [DEBUG] 静态数据中没有{self.year}年的数据")
+            logger.error("静态数据中没有%s年的数据", self.year)
             raise ValueError(f"静态数据中没有{self.year}年的数据")
         
-        # 构建分数到排名的映射（全市和市六区）
+        # 一次遍历：构建分数到排名的映射（全市和市六区），用集合去重，
+        # 同时记录总人数（最大的累计值）
+        score_set = set()
+        total_city = total_inner = 0
         for record in year_data:
             score = float(record['score'])
             
@@ -45,30 +61,78 @@ class ImprovedRankCalculator:
             if record['total_city'] > 0:
                 city_rank = int(record['total_city'])
                 self.score_rank_map_city[score] = city_rank
-                if score not in self.sorted_scores:
-                    self.sorted_scores.append(score)
+                score_set.add(score)
+                total_city = max(total_city, record['total_city'])
             
             # 市六区排名
             if record['inner_six'] > 0:
                 inner_rank = int(record['inner_six'])
                 self.score_rank_map_inner[score] = inner_rank
-                if score not in self.sorted_scores:
-                    self.sorted_scores.append(score)
+                score_set.add(score)
+                total_inner = max(total_inner, record['inner_six'])
         
         # 确保分数按降序排列
-        self.sorted_scores = list(set(self.sorted_scores))
-        self.sorted_scores.sort(reverse=True)
-        
-        # 总人数是最大的累计值
-        self.total_students_city = max(record['total_city'] for record in year_data if record['total_city'] > 0)
-        self.total_students_inner = max(record['inner_six'] for record in year_data if record['inner_six'] > 0)
-        
-        print(f"🔍 [DEBUG] 数据加载完成:")
-        print(f"🔍 [DEBUG] - 总记录数: {len(self.sorted_scores)}")
-        print(f"🔍 [DEBUG] - 最高分: {max(self.sorted_scores) if self.sorted_scores else 0}")
-        print(f"🔍 [DEBUG] - 最低分: {min(self.sorted_scores) if self.sorted_scores else 0}")
-        print(f"🔍 [DEBUG] - 全市总学生数: {self.total_students_city}")
-        print(f"🔍 [DEBUG] - 市六区总学生数: {self.total_students_inner}")
+        self.sorted_scores = sorted(score_set, reverse=True)
+        self._asc_scores = self.sorted_scores[::-1]
+        
+        self.total_students_city = total_city
+        self.total_students_inner = total_inner
+        
+        # np.interp 所需的升序分数及对应排名
+        self._xp_city, self._fp_city = self._interp_points(self.score_rank_map_city)
+        self._xp_inner, self._fp_inner = self._interp_points(self.score_rank_map_inner)
+        
+        logger.debug(
+            "数据加载完成: 总记录数 %d，最高分 %s，最低分 %s，全市总学生数 %d，市六区总学生数 %d",
+            len(self.sorted_scores),
+            self.sorted_scores[0] if self.sorted_scores else 0,
+            self.sorted_scores[-1] if self.sorted_scores else 0,
+            self.total_students_city,
+            self.total_students_inner,
+        )
+    
+    @staticmethod
+    def _interp_points(score_rank_map: Dict[float, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """把分数→排名映射转换为 np.interp 使用的 (升序分数数组, 排名数组)"""
+        xp = np.array(sorted(score_rank_map), dtype=np.float64)
+        fp = np.array([score_rank_map[s] for s in xp.tolist()], dtype=np.float64)
+        return xp, fp
+    
+    def _interp_args(self, rank_type: str) -> Tuple[np.ndarray, np.ndarray, int]:
+        """返回指定排名类型的 (分数节点, 排名节点, 总人数)"""
+        if rank_type == 'city':
+            return self._xp_city, self._fp_city, self.total_students_city
+        return self._xp_inner, self._fp_inner, self.total_students_inner
+    
+    def _build_rank_tables(self):
+        """预计算0-800分（0.01分精度）全部分数的排名表
+
+        与 _linear_interpolate 使用同一个 np.interp 计算，查询时直接按下标取值。
+        """
+        query_scores = np.arange(MAX_SCORE_X100 + 1) / 100
+        self.city_rank_table = self._interpolate_table(query_scores, 'city')
+        self.inner_rank_table = self._interpolate_table(query_scores, 'inner')
+    
+    def _interpolate_table(self, query_scores: np.ndarray, rank_type: str = 'city') -> np.ndarray:
+        """对一组分数批量执行线性插值，返回排名数组"""
+        xp, fp, total_students = self._interp_args(rank_type)
+        # 低于最低分取总人数，高于最高分取第1名
+        return np.rint(np.interp(query_scores, xp, fp, left=total_students, right=1)).astype(np.int32)
+    
+    def _neighbor_scores(self, score: float) -> Tuple[Optional[float], Optional[float]]:
+        """二分查找严格高于/低于 score 的最近分数，返回 (higher, lower)，不存在时为 None"""
+        i = bisect_left(self._asc_scores, score)
+        j = bisect_right(self._asc_scores, score, i)
+        lower = self._asc_scores[i - 1] if i > 0 else None
+        higher = self._asc_scores[j] if j < len(self._asc_scores) else None
+        return higher, lower
+    
+    def _lookup_ranks(self, score: float) -> Tuple[int, int]:
+        """同时查询 (全市排名, 市六区排名)：两张预计算表共用同一个下标，无法查表时退回线性插值"""
+        score_x100 = int(round(score * 100))
+        if 0 <= score_x100 <= MAX_SCORE_X100 and score_x100 / 100 == score:
+            return int(self.city_rank_table[score_x100]), int(self.inner_rank_table[score_x100])
+        return self._linear_interpolate(score, 'city'), self._linear_interpolate(score, 'inner')
     
     def _linear_interpolate(self, score: float, rank_type: str = 'city') -> int:
         """
@@ -81,70 +145,10 @@ class ImprovedRankCalculator:
         返回:
             插值计算得到的排名
         """
-        # 选择对应的数据
-        if rank_type == 'city':
-            score_rank_map = self.score_rank_map_city
-            total_students = self.total_students_city
-        else:
-            score_rank_map = self.score_rank_map_inner
-            total_students = self.total_students_inner
-        
-        # 如果分数正好在数据中，直接返回
-        if score in score_rank_map:
-            return score_rank_map[score]
-        
-        # 找到相邻的两个分数
-        higher_score = None
-        lower_score = None
-        
-        for s in self.sorted_scores:
-            if s > score:
-                higher_score = s
-            elif s < score:
-                if higher_score is not None:
-                    lower_score = s
-                    break
-        
-        # 边界情况处理
-        if higher_score is None:  # 分数高于最高分
-            return 1
-        if lower_score is None:  # 分数低于最低分
-            return total_students
-        
-        # 检查两个分数在对应排名类型中是否都有数据
-        if higher_score not in score_rank_map or lower_score not in score_rank_map:
-            # 如果某个分数没有对应类型的数据，查找其他相邻分数
-            for s in self.sorted_scores:
-                if s in score_rank_map:
-                    if s > score and (higher_score is None or s < higher_score):
-                        higher_score = s
-                    elif s < score and (lower_score is None or s > lower_score):
-                        lower_score = s
-        
-        # 如果还是找不到合适的数据点，返回边界值
-        if higher_score not in score_rank_map or lower_score not in score_rank_map:
-            if higher_score in score_rank_map:
-                return score_rank_map[higher_score]
-            elif lower_score in score_rank_map:
-                return score_rank_map[lower_score]
-            else:
-                return total_students
-        
-        # 线性插值计算
-        higher_rank = score_rank_map[higher_score]
-        lower_rank = score_rank_map[lower_score]
-        
-        # 计算插值比例
-        score_range = lower_score - higher_score
-        score_diff = score - higher_score
-        fraction = score_diff / score_range
-        
-        # 排名插值（注意：分数越高，排名数字越小）
-        rank_diff = lower_rank - higher_rank
-        interpolated_rank = higher_rank + fraction * rank_diff
-        
-        # 四舍五入到最近的整数
-        return int(round(interpolated_rank))
+        xp, fp, total_students = self._interp_args(rank_type)
+        # 二分查找相邻分数并线性插值（np.interp 在 C 层完成），
+        # 低于最低分取总人数，高于最高分取第1名，四舍五入到最近的整数
+        return int(round(np.interp(score, xp, fp, left=total_students, right=1)))
     
     def calculate_rank(self, score: float) -> Dict[str, Any]:
         """
@@ -161,18 +165,13 @@ class ImprovedRankCalculator:
         if not 0 <= score <= 800:
             raise ValueError(f"分数必须在0-800之间，当前输入：{score}")
         
-        # 验证精度（支持0.01分，修复浮点数精度问题）
-        score_str = str(score)
-        decimal_index = score_str.find('.')
-        if decimal_index != -1 and len(score_str) - decimal_index - 1 > 2:
+        # 验证精度（支持0.01分）：换算为整数0.01分后必须能还原为原值
+        if round(score * 100) / 100 != score:
             raise ValueError(f"分数仅支持保留两位小数，当前输入：{score}")
         
-        # 计算全市排名
-        city_rank = self._linear_interpolate(score, 'city')
+        # 计算全市和市六区排名
+        city_rank, inner_rank = self._lookup_ranks(score)
         city_rank = max(1, min(city_rank, self.total_students_city))
-        
-        # 计算市六区排名
-        inner_rank = self._linear_interpolate(score, 'inner')
         inner_rank = max(1, min(inner_rank, self.total_students_inner))
         
         # 计算百分位
@@ -187,14 +186,7 @@ class ImprovedRankCalculator:
             method = "精确匹配（数据库中存在该分数）"
         else:
             # 找到用于插值的分数
-            higher = None
-            lower = None
-            for s in self.sorted_scores:
-                if s > score:
-                    higher = s
-                elif s < score:
-                    lower = s
-                    break
+            higher, lower = self._neighbor_scores(score)
             if higher and lower:
                 method = f"线性插值（基于{higher}分和{lower}分）"
             else:
@@ -220,6 +212,33 @@ class ImprovedRankCalculator:
             'cumulative_count': city_rank
         }
     
+    def calculate_rank_batch(self, scores: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        批量计算全市和市六区排名（向量化，适用于一次查询大量分数）
+
+        参数:
+            scores: 中考分数数组（0-800，支持0.01精度）
+
+        返回:
+            字段与 calculate_rank 对应的数组字典（不含计算方法说明）
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.size and (scores.min() < 0 or scores.max() > 800):
+            raise ValueError("分数必须在0-800之间")
+
+        city_rank = np.clip(self._interpolate_table(scores, 'city'), 1, self.total_students_city)
+        inner_rank = np.clip(self._interpolate_table(scores, 'inner'), 1, self.total_students_inner)
+
+        return {
+            'score': scores,
+            'city_rank': city_rank,
+            'inner_rank': inner_rank,
+            'city_percentage': np.round(city_rank / self.total_students_city * 100, 2),
+            'city_percentile': np.round((self.total_students_city - city_rank + 1) / self.total_students_city * 100, 2),
+            'inner_percentage': np.round(inner_rank / self.total_students_inner * 100, 2),
+            'inner_percentile': np.round((self.total_students_inner - inner_rank + 1) / self.total_students_inner * 100, 2),
+        }
+
     def get_interpolation_details(self, score: float, rank_type: str = 'city') -> Dict[str, Any]:
         """获取插值计算的详细信息（用于调试和验证）"""
         score_rank_map = self.score_rank_map_city if rank_type == 'city' else self.score_rank_map_inner
@@ -235,14 +254,7 @@ class ImprovedRankCalculator:
             details['method'] = 'exact'
         else:
             # 找到相邻分数
-            higher = None
-            lower = None
-            for s in self.sorted_scores:
-                if s > score:
-                    higher = s
-                elif s < score:
-                    lower = s
-                    break
+            higher, lower = self._neighbor_scores(score)
             
             if higher and lower and higher in score_rank_map and lower in score_rank_map:
                 higher_rank = score_rank_map[higher]
@@ -269,6 +281,12 @@ class ImprovedRankCalculator:
         return details
 
 
+@lru_cache(maxsize=8)
+def get_rank_calculator(year: int = 2025) -> ImprovedRankCalculator:
+    """获取指定年份的计算器，首次调用时加载数据并预计算排名表（按年份缓存，构建一次后复用）"""
+    return ImprovedRankCalculator(year)
+
+
 def calculate_enhanced_rank(score: float, year: int = 2025, db_path: Optional[str] = None) -> Dict[str, Any]:
     """
     计算增强的排名信息（包含全市和市六区）
@@ -282,7 +300,8 @@ def calculate_enhanced_rank(score: float, year: int = 2025, db_path: Optional[st
         包含详细排名信息的字典
     """
     try:
-        calculator = ImprovedRankCalculator(year)
+        # 排名直接查预计算的0.01分排名表，无需再缓存结果
+        calculator = get_rank_calculator(year)
         result = calculator.calculate_rank(score)
         
         # 兼容性处理 - 保持原有的返回格式，但添加新的全市排名信息
@@ -299,16 +318,18 @@ def calculate_enhanced_rank(score: float, year: int = 2025, db_path: Optional[st
         }
         
     except Exception as e:
-        print(f"❌ [DEBUG] calculate_enhanced_rank 错误: {str(e)}")
+        logger.error("calculate_enhanced_rank 错误: %s", e)
         raise e
 
 
 def get_detailed_analysis(result: Dict[str, any]) -> str:
     """生成详细的成绩分析"""
-    rank = result['rank']
-    total = result['total_students']
-    percentage = result['percentage']
-    
+    return _analysis_text(result['percentage'])
+
+
+@lru_cache(maxsize=8192)
+def _analysis_text(percentage: float) -> str:
+    """分析文本只取决于全市百分位，按百分位缓存"""
     if percentage >= 95:
         level = "顶尖"
         advice = "您的成绩非常优秀，在全市名列前茅！"
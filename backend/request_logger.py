@@ -1,28 +1,111 @@
 """
 请求日志记录模块
 记录每次API请求的详细信息和API密钥使用统计
+
+请求记录以 JSON Lines 格式追加写入（每行一条），API密钥统计保存在内存中，
+定期及进程退出时写入快照文件。文件写入由后台线程完成，记录请求时不访问磁盘。
 """
-import json
+import atexit
 import os
+import queue
+import time
+from bisect import bisect_right
+from collections import defaultdict, deque
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 import threading
-from collections import defaultdict
+
+import orjson
+
+# 内存中保留的最近请求数量（用于统计）
+MAX_RECENT_REQUESTS = 1000
+# 日志文件超过该大小时压缩为最近的请求记录
+MAX_LOG_FILE_BYTES = 1024 * 1024
+# 每记录多少条请求写一次密钥统计快照
+KEY_STATS_SNAPSHOT_INTERVAL = 100
+
+
+def _to_epoch(value) -> float:
+    """时间统一为 epoch 秒（兼容旧日志中的 ISO 时间字符串）"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return value
+
+
+def _format_time(ts: float) -> str:
+    """epoch 秒格式化为 ISO 时间字符串（仅在输出统计时调用）"""
+    return datetime.fromtimestamp(ts).isoformat()
+
 
 class RequestLogger:
     """请求日志记录器"""
     
-    def __init__(self, log_file: str = "api_requests.json"):
-        self.log_file = Path(__file__).parent / log_file
+    def __init__(self,
+                 log_file: str = "api_requests.jsonl",
+                 key_stats_file: str = "key_stats.json",
+                 legacy_log_file: str = "api_requests.json"):
+        base_dir = Path(__file__).parent
+        self.log_file = base_dir / log_file
+        self.key_stats_file = base_dir / key_stats_file
         self.lock = threading.Lock()
-        self._ensure_log_file()
+        self._requests = deque(maxlen=MAX_RECENT_REQUESTS)  # 最近的请求记录
+        # 最近请求的汇总计数，随记录增减实时维护，get_stats 无需遍历
+        self._valid_key_count = 0
+        self._endpoint_counts: Dict[str, int] = defaultdict(int)
+        self._response_time_sum = 0.0
+        self._response_time_count = 0
+        self._key_stats: Dict[str, Dict] = {}
+        # 以下状态只由写入线程访问
+        self._write_queue: "queue.Queue[Optional[List[Dict]]]" = queue.Queue()
+        self._written = deque(maxlen=MAX_RECENT_REQUESTS)  # 已写入日志文件的最近记录（压缩文件时使用）
+        self._log_fd: Optional[int] = None  # 以 O_APPEND 打开的日志文件描述符
+        self._log_size = 0  # 日志文件当前大小
+        self._unsaved_count = 0  # 上次快照后新增的请求数
+        self._load_state(base_dir / legacy_log_file)
+        self._writer = threading.Thread(target=self._writer_loop, name="request-log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
     
-    def _ensure_log_file(self):
-        """确保日志文件存在"""
-        if not self.log_file.exists():
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                json.dump({"requests": [], "key_stats": {}}, f, ensure_ascii=False)
+    def _load_state(self, legacy_log_file: Path):
+        """启动时载入已有的请求记录和密钥统计，旧版整文件 JSON 日志会被迁移"""
+        try:
+            if self.log_file.exists():
+                with open(self.log_file, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            self._add_request(self._upgrade_record(orjson.loads(line)))
+                self._written.extend(self._requests)
+                if self.key_stats_file.exists():
+                    with open(self.key_stats_file, 'rb') as f:
+                        self._key_stats = self._upgrade_key_stats(orjson.loads(f.read()))
+            elif legacy_log_file.exists():
+                with open(legacy_log_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                for record in data.get("requests", []):
+                    self._add_request(self._upgrade_record(record))
+                self._key_stats = self._upgrade_key_stats(data.get("key_stats", {}))
+                self._written.extend(self._requests)
+                self._rewrite_log()
+                self._save_key_stats()
+        except Exception as e:
+            print(f"载入请求日志失败: {str(e)}")
+    
+    @staticmethod
+    def _upgrade_record(record: Dict) -> Dict:
+        """旧格式记录的 ISO 时间字符串 timestamp 转换为 epoch 秒 ts"""
+        if "ts" not in record:
+            record = {"ts": _to_epoch(record.pop("timestamp")), **record}
+        return record
+    
+    @staticmethod
+    def _upgrade_key_stats(key_stats: Dict[str, Dict]) -> Dict[str, Dict]:
+        for stats in key_stats.values():
+            stats["first_seen"] = _to_epoch(stats["first_seen"])
+            if "last_seen" in stats:
+                stats["last_seen"] = _to_epoch(stats["last_seen"])
+        return key_stats
     
     def log_request(self, 
                    endpoint: str,
@@ -33,105 +116,248 @@ class RequestLogger:
                    client_ip: str,
                    user_agent: str,
                    request_data: Dict = None,
-                   error: str = None):
-        """记录单次请求"""
-        with self.lock:
+                   error: str = None,
+                   timestamp: Optional[float] = None):
+        """记录单次请求（timestamp 为 epoch 秒，默认为当前时间）"""
+        self.log_requests([{
+            "endpoint": endpoint,
+            "api_key": api_key,
+            "is_valid_key": is_valid_key,
+            "status_code": status_code,
+            "response_time": response_time,
+            "client_ip": client_ip,
+            "user_agent": user_agent,
+            "request_data": request_data,
+            "error": error,
+            "timestamp": timestamp
+        }])
+    
+    def log_requests(self, entries: List[Dict]):
+        """
+        批量记录请求：只更新内存中的统计，文件写入交给后台线程
+        
+        参数:
+            entries: 请求记录列表，每项的键与 log_request 的参数相同
+        """
+        if not entries:
+            return
+        
+        try:
+            with self.lock:
+                records = [self._append_entry(self._key_stats, **entry) for entry in entries]
+                for record in records:
+                    self._add_request(record)
+            self._write_queue.put_nowait(records)
+        except Exception as e:
+            print(f"记录请求日志失败: {str(e)}")
+    
+    def close(self):
+        """停止后台写入线程，写入队列中剩余的记录和密钥统计快照"""
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join(timeout=5)
+    
+    def _writer_loop(self):
+        """后台写入线程：合并队列中已有的记录，一次追加写入日志文件"""
+        while True:
+            batch = self._write_queue.get()
+            stop = batch is None
+            records = [] if stop else batch
+            while not stop:
+                try:
+                    batch = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    stop = True
+                else:
+                    records.extend(batch)
+            
             try:
-                # 读取现有数据
-                with open(self.log_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # 添加新请求记录
-                request_log = {
-                    "timestamp": datetime.now().isoformat(),
-                    "endpoint": endpoint,
-                    "api_key": api_key[:10] + "..." if api_key and len(api_key) > 10 else api_key,
-                    "is_valid_key": is_valid_key,
-                    "status_code": status_code,
-                    "response_time_ms": round(response_time * 1000, 2),
-                    "client_ip": client_ip,
-                    "user_agent": user_agent,
-                    "request_data": request_data,
-                    "error": error
-                }
-                
-                # 限制请求日志数量（保留最近1000条）
-                data["requests"].append(request_log)
-                if len(data["requests"]) > 1000:
-                    data["requests"] = data["requests"][-1000:]
-                
-                # 更新API密钥统计
-                if api_key:
-                    key_stat_id = api_key[:10] + "..." if len(api_key) > 10 else api_key
-                    if key_stat_id not in data["key_stats"]:
-                        data["key_stats"][key_stat_id] = {
-                            "first_seen": datetime.now().isoformat(),
-                            "total_requests": 0,
-                            "successful_requests": 0,
-                            "failed_requests": 0,
-                            "endpoints": {}
-                        }
-                    
-                    stats = data["key_stats"][key_stat_id]
-                    stats["total_requests"] += 1
-                    stats["last_seen"] = datetime.now().isoformat()
-                    
-                    if status_code < 400:
-                        stats["successful_requests"] += 1
-                    else:
-                        stats["failed_requests"] += 1
-                    
-                    # 按端点统计
-                    if endpoint not in stats["endpoints"]:
-                        stats["endpoints"][endpoint] = 0
-                    stats["endpoints"][endpoint] += 1
-                
-                # 写回文件
-                with open(self.log_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                    
+                if records:
+                    self._write_records(records)
+                if stop:
+                    self._save_key_stats()
+                    self._close_log_fd()
             except Exception as e:
                 print(f"记录请求日志失败: {str(e)}")
+            if stop:
+                return
+    
+    def _close_log_fd(self):
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def _write_records(self, records: List[Dict]):
+        # 日志文件只打开一次，以 O_APPEND 追加写入，整批数据一次系统调用
+        if self._log_fd is None:
+            self._log_fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._log_size = os.fstat(self._log_fd).st_size
+        data = memoryview(self._dump_lines(records))
+        self._log_size += len(data)
+        while data:
+            data = data[os.write(self._log_fd, data):]
+        self._written.extend(records)
+        
+        # 文件过大时只保留最近的请求记录
+        if self._log_size > MAX_LOG_FILE_BYTES:
+            self._rewrite_log()
+        
+        self._unsaved_count += len(records)
+        if self._unsaved_count >= KEY_STATS_SNAPSHOT_INTERVAL:
+            self._save_key_stats()
+    
+    def _add_request(self, record: Dict):
+        """把请求记录加入最近请求队列并更新汇总计数（超出上限时移出最旧的记录）"""
+        if len(self._requests) == self._requests.maxlen:
+            self._update_counters(self._requests[0], -1)
+        self._requests.append(record)
+        self._update_counters(record, 1)
+    
+    def _update_counters(self, record: Dict, delta: int):
+        if record["is_valid_key"]:
+            self._valid_key_count += delta
+        endpoint_count = self._endpoint_counts[record["endpoint"]] + delta
+        if endpoint_count:
+            self._endpoint_counts[record["endpoint"]] = endpoint_count
+        else:
+            del self._endpoint_counts[record["endpoint"]]
+        if record.get("response_time_ms"):
+            self._response_time_sum += delta * record["response_time_ms"]
+            self._response_time_count += delta
+    
+    @staticmethod
+    def _dump_lines(records) -> bytes:
+        """把请求记录序列化为 JSON Lines（紧凑格式，每条一行）"""
+        return b''.join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records)
+    
+    def _rewrite_log(self):
+        """用内存中最近的请求记录替换日志文件（先写临时文件再原子替换）"""
+        tmp_file = self.log_file.with_name(self.log_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(self._dump_lines(self._written))
+        os.replace(tmp_file, self.log_file)
+        # 原描述符仍指向被替换的旧文件，下次写入时重新打开
+        self._close_log_fd()
+    
+    def _copy_key_stats(self) -> Dict[str, Dict]:
+        """复制密钥统计（调用方需持有锁），供锁外序列化使用"""
+        return {
+            key_id: {**stats, "endpoints": dict(stats["endpoints"])}
+            for key_id, stats in self._key_stats.items()
+        }
+    
+    def _save_key_stats(self):
+        """把密钥统计写入快照文件（先写临时文件再原子替换）"""
+        with self.lock:
+            key_stats = self._copy_key_stats()
+        tmp_file = self.key_stats_file.with_name(self.key_stats_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(key_stats))
+        os.replace(tmp_file, self.key_stats_file)
+        self._unsaved_count = 0
+    
+    @staticmethod
+    def _append_entry(key_stats: Dict,
+                      endpoint: str,
+                      api_key: Optional[str],
+                      is_valid_key: bool,
+                      status_code: int,
+                      response_time: float,
+                      client_ip: str,
+                      user_agent: str,
+                      request_data: Dict = None,
+                      error: str = None,
+                      timestamp: Optional[float] = None) -> Dict:
+        """更新密钥统计，返回单条请求记录"""
+        ts = timestamp or time.time()
+        # 日志和统计中只保留密钥前缀
+        key_id = api_key[:10] + "..." if api_key and len(api_key) > 10 else api_key
+        
+        # 新请求记录
+        request_log = {
+            "ts": ts,
+            "endpoint": endpoint,
+            "api_key": key_id,
+            "is_valid_key": is_valid_key,
+            "status_code": status_code,
+            "response_time_ms": round(response_time * 1000, 2),
+            "client_ip": client_ip,
+            "user_agent": user_agent,
+            "request_data": request_data,
+            "error": error
+        }
+        
+        # 更新API密钥统计
+        if api_key:
+            stats = key_stats.get(key_id)
+            if stats is None:
+                stats = key_stats[key_id] = {
+                    "first_seen": ts,
+                    "total_requests": 0,
+                    "successful_requests": 0,
+                    "failed_requests": 0,
+                    "endpoints": {}
+                }
+            
+            stats["total_requests"] += 1
+            stats["last_seen"] = ts
+            
+            if status_code < 400:
+                stats["successful_requests"] += 1
+            else:
+                stats["failed_requests"] += 1
+            
+            # 按端点统计
+            endpoints = stats["endpoints"]
+            endpoints[endpoint] = endpoints.get(endpoint, 0) + 1
+        
+        return request_log
     
     def get_stats(self) -> Dict:
         """获取统计数据"""
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            cutoff = time.time() - 86400
+            with self.lock:
+                # 只复制需要返回的最近50条请求
+                requests = list(islice(reversed(self._requests), 50))[::-1]
+                key_stats = self._copy_key_stats()
+                # 最近24小时统计：记录按时间顺序追加，二分查找第一条24小时内的记录
+                requests_24h = len(self._requests) - bisect_right(self._requests, cutoff, key=lambda r: r["ts"])
+                # 汇总统计和按端点统计直接取实时计数
+                total_requests = len(self._requests)
+                valid_key_requests = self._valid_key_count
+                endpoint_stats = dict(self._endpoint_counts)
+                response_time_sum = self._response_time_sum
+                response_time_count = self._response_time_count
             
-            # 计算汇总统计
-            total_requests = len(data["requests"])
-            valid_key_requests = sum(1 for r in data["requests"] if r["is_valid_key"])
             invalid_key_requests = total_requests - valid_key_requests
             
-            # 按端点统计
-            endpoint_stats = defaultdict(int)
-            for request in data["requests"]:
-                endpoint_stats[request["endpoint"]] += 1
-            
-            # 最近24小时统计
-            now = datetime.now()
-            recent_requests = [
-                r for r in data["requests"] 
-                if (now - datetime.fromisoformat(r["timestamp"])).total_seconds() < 86400
-            ]
+            # 只在输出时把时间格式化为 ISO 字符串
+            for stats in key_stats.values():
+                stats["first_seen"] = _format_time(stats["first_seen"])
+                if "last_seen" in stats:
+                    stats["last_seen"] = _format_time(stats["last_seen"])
             
             # 平均响应时间
-            response_times = [r["response_time_ms"] for r in data["requests"] if r.get("response_time_ms")]
-            avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+            avg_response_time = response_time_sum / response_time_count if response_time_count else 0
             
             return {
                 "summary": {
                     "total_requests": total_requests,
                     "valid_key_requests": valid_key_requests,
                     "invalid_key_requests": invalid_key_requests,
-                    "unique_api_keys": len(data["key_stats"]),
+                    "unique_api_keys": len(key_stats),
                     "avg_response_time_ms": round(avg_response_time, 2),
-                    "requests_24h": len(recent_requests)
+                    "requests_24h": requests_24h
                 },
-                "endpoint_stats": dict(endpoint_stats),
-                "key_stats": data["key_stats"],
-                "recent_requests": data["requests"][-50:]  # 最近50条请求
+                "endpoint_stats": endpoint_stats,
+                "key_stats": key_stats,
+                "recent_requests": [  # 最近50条请求
+                    {"timestamp": _format_time(r["ts"]), **{k: v for k, v in r.items() if k != "ts"}}
+                    for r in requests
+                ]
             }
         except Exception as e:
             print(f"获取统计数据失败: {str(e)}")
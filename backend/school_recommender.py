@@ -6,8 +6,14 @@
 from __future__ import annotations
 
 import importlib
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+# 推荐档位，顺序与 _recommend_indices 返回的下标元组一致
+_TIERS = ("冲", "稳", "保")
+
 # ---------------------------------------------------------------------------
 # 数据加载辅助
 # ---------------------------------------------------------------------------
@@ -31,6 +37,24 @@ def _load_admission_data(year: int):
     return getattr(module, data_var)
 
 
+@lru_cache(maxsize=8)
+def _load_year(year: int) -> Tuple[Tuple[Dict, ...], np.ndarray]:
+    """按年份缓存 (按录取位次升序的学校列表, 对应的录取位次数组)。
+
+    招生数据为静态常量，过滤和排序只需做一次；返回结果共享，调用方不应修改。
+    """
+    key_rank = f"{year}年录取位次"
+
+    # 过滤掉缺失位次数据的学校，按录取位次升序（越靠前越难考）
+    schools = sorted(
+        (s for s in _load_admission_data(year) if s.get(key_rank, 0)),
+        key=lambda s: s[key_rank],
+    )
+    ranks = np.array([s[key_rank] for s in schools], dtype=np.int64)
+    ranks.setflags(write=False)
+    return tuple(schools), ranks
+
+
 # ---------------------------------------------------------------------------
 # 主函数
 # ---------------------------------------------------------------------------
@@ -54,73 +78,71 @@ def recommend_schools_by_rank(
     if rank <= 0:
         raise ValueError("rank 必须是正整数")
 
-    attack_n, stable_n, safe_n = scheme
+    scheme = tuple(scheme)
     if any(n <= 0 for n in scheme):
         raise ValueError("scheme 中的数量必须为正整数")
 
-    # 加载招生数据
-    admission_data = _load_admission_data(year)
+    # 推荐结果按 (位次, 年份, 方案) 缓存为学校下标，这里只需映射回学校信息
+    schools, _ = _load_year(year)
+    return _hydrate(_recommend_indices(rank, year, scheme), schools)
 
-    key_rank = f"{year}年录取位次"
 
-    # 过滤掉缺失位次数据的学校
-    schools = [s for s in admission_data if s.get(key_rank, 0)]
-
-    # 按录取位次升序（越靠前越难考）
-    schools.sort(key=lambda s: s[key_rank])
-
-    attack: List[Dict] = []  # 冲
-    stable: List[Dict] = []  # 稳
-    safe: List[Dict] = []    # 保
-
-    for sch in schools:
-        sch_rank = sch[key_rank]
-        ratio = sch_rank / rank
-        # 更保守的冲稳保策略：
-        # 冲档：学校录取位次在考生位次的 75%-95% 区间（有合理的冲击希望）
-        # 稳档：学校录取位次在考生位次的 95%-115% 区间（录取概率较高）
-        # 保档：学校录取位次在考生位次的 115%-140% 区间（基本确保录取）
-        if 0.75 <= ratio <= 0.95 and len(attack) < attack_n:
-            attack.append(sch)
-        elif 0.95 < ratio <= 1.15 and len(stable) < stable_n:
-            stable.append(sch)
-        elif 1.15 < ratio <= 1.4 and len(safe) < safe_n:
-            safe.append(sch)
-
-        # 提前结束
-        if (
-            len(attack) == attack_n and
-            len(stable) == stable_n and
-            len(safe) == safe_n
-        ):
-            break
+def _hydrate(
+    indices: Tuple[Tuple[int, ...], ...], schools: Tuple[Dict, ...]
+) -> Dict[str, List[Dict]]:
+    """把 (冲, 稳, 保) 各档的学校下标映射为 {档位: [学校信息, ...]}（每次返回新列表）"""
+    return {tier: [schools[i] for i in idx] for tier, idx in zip(_TIERS, indices)}
+
+
+@lru_cache(maxsize=4096)
+def _recommend_indices(
+    rank: int, year: int, scheme: Tuple[int, int, int]
+) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """计算 (冲, 稳, 保) 各档学校在 `_load_year(year)` 学校列表中的下标。
+
+    结果只取决于参数，按精确位次缓存：区间边界按比值判定，
+    位次分桶会改变临界学校的归属，因此不做分桶。
+    """
+    attack_n, stable_n, safe_n = scheme
+
+    # 按录取位次升序的学校及录取位次数组（按年份缓存）
+    schools, ranks = _load_year(year)
+
+    # 与考生位次的比值：录取位次升序，比值同样升序，每个区间对应一段连续下标
+    ratios = ranks / rank
+    used = np.zeros(len(schools), dtype=bool)  # 已被选入某一档的学校
+
+    def _take(lo: float, hi: float, n: int, include_lo: bool = True) -> List[int]:
+        """按录取位次顺序取出比值在 [lo, hi]（include_lo 为 False 时为 (lo, hi]）
+        区间内且未被选用的前 n 所学校的下标，区间边界用二分查找确定"""
+        start = np.searchsorted(ratios, lo, side='left' if include_lo else 'right')
+        stop = np.searchsorted(ratios, hi, side='right')
+        idx = np.flatnonzero(~used[start:stop])[:n] + start
+        used[idx] = True
+        return idx.tolist()
+
+    # 更保守的冲稳保策略：
+    # 冲档：学校录取位次在考生位次的 75%-95% 区间（有合理的冲击希望）
+    # 稳档：学校录取位次在考生位次的 95%-115% 区间（录取概率较高）
+    # 保档：学校录取位次在考生位次的 115%-140% 区间（基本确保录取）
+    attack = _take(0.75, 0.95, attack_n)                    # 冲
+    stable = _take(0.95, 1.15, stable_n, include_lo=False)  # 稳
+    safe = _take(1.15, 1.4, safe_n, include_lo=False)       # 保
 
     # 智能补齐逻辑：如果某档不足，用相邻档位或放宽条件的学校补齐
-    def _fill_intelligently():
-        # 如果冲档不足，从稳档前部补齐
-        if len(attack) < attack_n:
-            candidates = [s for s in schools 
-                         if s not in attack and s not in stable and s not in safe
-                         and 0.7 <= (s[key_rank] / rank) <= 0.95]  # 放宽冲档条件到70%-95%
-            attack.extend(candidates[:attack_n - len(attack)])
-        
-        # 如果稳档不足，从冲档后部和保档前部补齐
-        if len(stable) < stable_n:
-            candidates = [s for s in schools 
-                         if s not in attack and s not in stable and s not in safe
-                         and 0.9 <= (s[key_rank] / rank) <= 1.2]  # 放宽稳档条件到90%-120%
-            stable.extend(candidates[:stable_n - len(stable)])
-        
-        # 如果保档不足，从稳档后部补齐
-        if len(safe) < safe_n:
-            candidates = [s for s in schools 
-                         if s not in attack and s not in stable and s not in safe
-                         and 1.1 <= (s[key_rank] / rank) <= 1.6]  # 放宽保档条件到110%-160%
-            safe.extend(candidates[:safe_n - len(safe)])
-
-    _fill_intelligently()
-
-    return {"冲": attack, "稳": stable, "保": safe}
+    # 如果冲档不足，从稳档前部补齐（放宽冲档条件到70%-95%）
+    if len(attack) < attack_n:
+        attack.extend(_take(0.7, 0.95, attack_n - len(attack)))
+
+    # 如果稳档不足，从冲档后部和保档前部补齐（放宽稳档条件到90%-120%）
+    if len(stable) < stable_n:
+        stable.extend(_take(0.9, 1.2, stable_n - len(stable)))
+
+    # 如果保档不足，从稳档后部补齐（放宽保档条件到110%-160%）
+    if len(safe) < safe_n:
+        safe.extend(_take(1.1, 1.6, safe_n - len(safe)))
+
+    return tuple(attack), tuple(stable), tuple(safe)
 
 
 # ---------------------------------------------------------------------------
@@ -3,22 +3,38 @@
 处理核心业务逻辑和计算
 """
 import logging
+from bisect import bisect_left
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
-from scipy import interpolate
 
 from config import settings, validate_score
-from dao import ScoreDAO, ScoreRecord, score_dao
+from dao import ScoreDAO, score_dao
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# 排名分析分档：位次 <= _ANALYSIS_RANK_BINS[i] 时使用 _ANALYSIS_LEVELS[i]，
+# 超过最后一档时使用 _ANALYSIS_LEVELS 的最后一项
+_ANALYSIS_RANK_BINS = (100, 500, 1500, 3000, 6000, 10000)
+_ANALYSIS_LEVELS = (
+    # (水平, 推荐学校, 建议用语)
+    ("顶尖", "南开、耀华、一中等顶级高中", "您有很大机会进入"),
+    ("很优秀", "市五所等重点高中", "您有很大机会进入"),
+    ("优秀", "实验、新华等优质高中", "可以考虑"),
+    ("良好", "二十中、四中等区重点高中", "可以考虑"),
+    ("中等偏上", "各区的重点高中", "可以考虑"),
+    ("中等", "区重点和普通高中", "可以考虑"),
+    ("一般", "普通高中，同时可以考虑职业教育等多元化发展路径", "可以考虑"),
+)
+
+
+@dataclass(slots=True)
 class RankResult:
-    """排名结果数据模型"""
+    """排名结果数据模型（使用 __slots__，批量结果不再为每个实例分配 __dict__）"""
     score: float
     year: int
     rank: int
@@ -28,7 +44,7 @@ class RankResult:
     calculation_method: str
     analysis: str
     segment_count: int = 0  # 当前分数段人数
-    timestamp: datetime = None
+    timestamp: Optional[datetime] = None  # 未指定时在构造时取当前时间
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -53,37 +69,41 @@ class RankResult:
 class RankCalculationService:
     """排名计算服务"""
     
+    # 插值节点缓存的最大年份数，超出时淘汰最久未使用的年份
+    _MAX_INTERPOLATOR_CACHE = 16
+    
     def __init__(self, dao: Optional[ScoreDAO] = None):
         self.dao = dao or score_dao
-        self._interpolators = {}  # 缓存插值函数
-        
-    def _get_interpolator(self, year: int) -> interpolate.interp1d:
-        """获取或创建插值函数"""
-        if year in self._interpolators:
-            return self._interpolators[year]
-        
-        # 获取所有分数记录
-        records = self.dao.get_score_records(year)
-        if not records:
+        # 缓存插值节点 {年份: (分数数组, 累计人数数组)}，按最近使用顺序排列
+        self._interpolators: OrderedDict[int, Tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        
+    def _get_interpolator(self, year: int) -> Tuple[np.ndarray, np.ndarray]:
+        """获取或创建插值节点（分数升序的 float64 数组及对应的累计人数）"""
+        interpolator = self._interpolators.get(year)
+        if interpolator is not None:
+            self._interpolators.move_to_end(year)
+            return interpolator
+        
+        # 获取分数升序数组和对应的累计人数数组
+        arrays = self.dao.get_score_arrays(year)
+        if arrays is None or len(arrays[0]) == 0:
             raise ValueError(f"没有找到{year}年的数据")
+        scores, cumulative = arrays
         
-        # 转换为numpy数组
-        scores = np.array([r.score for r in records], dtype=np.float64)
-        cumulative = np.array([r.inner_six for r in records], dtype=np.int64)
-        
-        # 创建插值函数（分数需要递增排序）
-        interpolator = interpolate.interp1d(
-            scores[::-1],  # 反转使其递增
-            cumulative[::-1],  # 对应的累计值
-            kind='linear',
-            bounds_error=False,
-            fill_value=(cumulative[-1], cumulative[0])
-        )
+        # 预先转换为 float64，np.interp 每次调用无需再复制
+        interpolator = (scores, np.ascontiguousarray(cumulative, dtype=np.float64))
         
-        # 缓存插值函数
+        # 缓存插值节点
         self._interpolators[year] = interpolator
+        if len(self._interpolators) > self._MAX_INTERPOLATOR_CACHE:
+            self._interpolators.popitem(last=False)
         return interpolator
     
+    def _interp(self, year: int, score: float) -> float:
+        """线性插值（低于最低分取总人数，高于最高分取最高分的累计值），返回 Python float"""
+        xs, ys = self._get_interpolator(year)
+        return float(np.interp(score, xs, ys, left=ys[0], right=ys[-1]))
+    
     def calculate_rank(self, score: float, year: Optional[int] = None) -> RankResult:
         """
         计算排名
@@ -109,6 +129,47 @@ class RankCalculationService:
                 f"且保留两位小数（如750.25、750.50）"
             )
         
+        return self._rank_result(score, year)
+    
+    def calculate_ranks_across_years(
+        self,
+        score: float,
+        years: List[int],
+        *,
+        timestamp: Optional[datetime] = None
+    ) -> List[RankResult]:
+        """
+        计算同一分数在多个年份的排名（分数只校验一次，各年份插值节点均已缓存）
+        
+        Args:
+            score: 分数
+            years: 年份列表，结果按该顺序返回
+            timestamp: 结果时间戳（默认取当前时间一次）
+            
+        Returns:
+            各年份的排名结果，缺少数据的年份记录警告后跳过
+            
+        Raises:
+            ValueError: 分数不合法
+        """
+        if not validate_score(score):
+            raise ValueError(
+                f"分数必须在{settings.min_score}-{settings.max_score}之间，"
+                f"且保留两位小数（如750.25、750.50）"
+            )
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        results = []
+        for year in years:
+            try:
+                results.append(self._rank_result(score, year, timestamp))
+            except ValueError as e:
+                logger.warning(f"计算{year}年{score}分排名失败: {e}")
+        return results
+    
+    def _rank_result(self, score: float, year: int, timestamp: Optional[datetime] = None) -> RankResult:
+        """计算已校验分数在指定年份的排名结果（数据不存在时抛出 ValueError）"""
         # 获取总人数
         total_students = self.dao.get_total_students(year)
         if total_students == 0:
@@ -142,63 +203,45 @@ class RankCalculationService:
             percentile=percentile,
             calculation_method=method,
             analysis=analysis,
-            segment_count=segment_count
+            segment_count=segment_count,
+            timestamp=timestamp
         )
     
     def _calculate_integer_score_rank(self, score: int, year: int) -> Tuple[int, str]:
         """计算整数分数的排名"""
-        record = self.dao.get_score_record(year, score)
+        inner_six = self.dao.get_inner_six(year, score)
         
-        if record:
+        if inner_six is not None:
             # 直接使用数据库中的累计值作为排名
-            return record.inner_six, "精确匹配（数据库中存在该分数）"
+            return inner_six, self._calculation_method(score, exact=True)
         else:
             # 分数不存在，使用插值
-            interpolator = self._get_interpolator(year)
-            rank = int(np.round(interpolator(float(score))))
-            return rank, f"插值计算（{score}分在数据库中不存在）"
+            rank = round(self._interp(year, float(score)))
+            return rank, self._calculation_method(score, exact=False)
     
     def _calculate_decimal_score_rank(self, score: float, year: int) -> Tuple[int, str]:
         """计算小数分数的排名"""
-        floor_score = int(score)
-        ceil_score = floor_score + 1
-        
-        # 获取相邻分数的记录
-        floor_record, ceil_record = self.dao.get_adjacent_scores(year, score)
-        
-        # 使用插值计算
-        interpolator = self._get_interpolator(year)
-        rank = int(np.round(interpolator(score)))
+        # 使用插值计算（插值函数已覆盖相邻分数，无需再单独查询相邻记录）
+        rank = round(self._interp(year, score))
         
-        return rank, f"线性插值（{floor_score}分-{ceil_score}分之间）"
+        return rank, self._calculation_method(score, exact=False)
+    
+    @staticmethod
+    def _calculation_method(score: float, exact: bool) -> str:
+        """生成计算方法说明（exact 表示整数分数在数据库中存在）"""
+        if exact:
+            return "精确匹配（数据库中存在该分数）"
+        floor_score = int(score)
+        if score == floor_score:
+            return f"插值计算（{floor_score}分在数据库中不存在）"
+        return f"线性插值（{floor_score}分-{floor_score + 1}分之间）"
     
     def _generate_analysis(self, rank: int, total_students: int, percentage: float) -> str:
-        """生成排名分析文本"""
-        if rank <= 100:
-            level = "顶尖"
-            schools = "南开、耀华、一中等顶级高中"
-        elif rank <= 500:
-            level = "很优秀"
-            schools = "市五所等重点高中"
-        elif rank <= 1500:
-            level = "优秀"
-            schools = "实验、新华等优质高中"
-        elif rank <= 3000:
-            level = "良好"
-            schools = "二十中、四中等区重点高中"
-        elif rank <= 6000:
-            level = "中等偏上"
-            schools = "各区的重点高中"
-        elif rank <= 10000:
-            level = "中等"
-            schools = "区重点和普通高中"
-        else:
-            level = "一般"
-            schools = "普通高中，同时可以考虑职业教育等多元化发展路径"
-        
+        """生成排名分析文本（按位次区间查表）"""
+        level, schools, advice = _ANALYSIS_LEVELS[bisect_left(_ANALYSIS_RANK_BINS, rank)]
         return (
             f"您的成绩{level}！在市六区排名第{rank}名（前{percentage:.1f}%）。"
-            f"{'您有很大机会进入' if rank <= 500 else '可以考虑'}{schools}。"
+            f"{advice}{schools}。"
         )
     
     def get_score_for_percentile(self, percentile: float, year: Optional[int] = None) -> Optional[float]:
@@ -208,21 +251,104 @@ class RankCalculationService:
         
         return self.dao.get_percentile_score(year, percentile)
     
-    def get_rank_batch(self, scores: List[float], year: Optional[int] = None) -> List[RankResult]:
-        """批量计算排名（性能优化）"""
+    def calculate_rank_bulk(self, scores: np.ndarray, year: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        向量化批量计算排名（一次 np.interp 处理整个分数数组）
+        
+        Args:
+            scores: 分数数组（调用方需保证已通过 validate_score 校验）
+            year: 年份（默认使用配置中的默认年份）
+            
+        Returns:
+            字典，包含 score、rank、percentage、percentile 四个等长数组
+            
+        Raises:
+            ValueError: 数据不存在
+        """
         if year is None:
             year = settings.default_year
         
-        results = []
-        for score in scores:
-            try:
-                result = self.calculate_rank(score, year)
-                results.append(result)
-            except ValueError as e:
-                logger.warning(f"计算{score}分排名失败: {e}")
-                continue
+        total_students = self.dao.get_total_students(year)
+        if total_students == 0:
+            raise ValueError(f"没有找到{year}年的数据")
         
-        return results
+        # 数据中存在的分数正好落在插值节点上，插值结果即为精确匹配的累计值
+        scores = np.asarray(scores, dtype=np.float64)
+        xs, ys = self._get_interpolator(year)
+        ranks = np.round(np.interp(scores, xs, ys, left=ys[0], right=ys[-1])).astype(np.int64)
+        ranks = np.clip(ranks, 1, total_students)
+        
+        return {
+            "score": scores,
+            "rank": ranks,
+            "percentage": (ranks / total_students) * 100,
+            "percentile": ((total_students - ranks + 1) / total_students) * 100,
+        }
+    
+    def get_rank_batch(
+        self,
+        scores: List[float],
+        year: Optional[int] = None,
+        *,
+        timestamp: Optional[datetime] = None
+    ) -> List[RankResult]:
+        """批量计算排名（性能优化）
+        
+        先对整批分数做向量化校验，再对合法分数一次性调用 calculate_rank_bulk，
+        结果与逐个调用 calculate_rank 相同；不合法的分数记录警告后跳过。
+        整批结果共用同一个时间戳（未指定时取当前时间一次）。
+        """
+        if year is None:
+            year = settings.default_year
+        if timestamp is None:
+            timestamp = datetime.now()
+        min_score, max_score = settings.min_score, settings.max_score
+        
+        # 向量化校验（与 validate_score 规则一致：范围内且保留两位小数）
+        values = np.asarray(scores, dtype=np.float64)
+        valid = (values >= min_score) & (values <= max_score) & (np.round(values * 100) / 100 == values)
+        for score in np.asarray(scores, dtype=object)[~valid]:
+            logger.warning(
+                f"计算{score}分排名失败: 分数必须在{min_score}-{max_score}之间，"
+                f"且保留两位小数（如750.25、750.50）"
+            )
+        valid_scores = [score for score, ok in zip(scores, valid.tolist()) if ok]
+        if not valid_scores:
+            return []
+        
+        try:
+            bulk = self.calculate_rank_bulk(values[valid], year)
+        except ValueError as e:
+            logger.warning(f"批量计算{year}年排名失败: {e}")
+            return []
+        total_students = self.dao.get_total_students(year)
+        
+        # 整数分数且在数据库中存在时为精确匹配
+        xs, _ = self._get_interpolator(year)
+        exact = (np.floor(bulk["score"]) == bulk["score"]) & np.isin(bulk["score"], xs)
+        
+        segment_count = self.dao.get_segment_count
+        return [
+            RankResult(
+                score=score,
+                year=year,
+                rank=rank,
+                total_students=total_students,
+                percentage=percentage,
+                percentile=percentile,
+                calculation_method=self._calculation_method(score, is_exact),
+                analysis=self._generate_analysis(rank, total_students, percentage),
+                segment_count=segment_count(year, score),
+                timestamp=timestamp
+            )
+            for score, rank, percentage, percentile, is_exact in zip(
+                valid_scores,
+                bulk["rank"].tolist(),
+                bulk["percentage"].tolist(),
+                bulk["percentile"].tolist(),
+                exact.tolist(),
+            )
+        ]
     
     def clear_cache(self):
         """清空缓存"""
@@ -236,12 +362,32 @@ class StatisticsService:
     
     def __init__(self, dao: Optional[ScoreDAO] = None):
         self.dao = dao or score_dao
+        # 复用同一个排名服务，各年份的插值节点只构建一次
+        self._rank_service = RankCalculationService(self.dao)
+        # 缓存年度统计 {年份: (基础统计, 分数段分布, 关键百分位)}，返回给调用方前需复制
+        self._stats_cache: Dict[int, Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]] = {}
     
     def get_statistics(self, year: Optional[int] = None) -> Dict[str, Any]:
         """获取年度统计信息"""
         if year is None:
             year = settings.default_year
         
+        cached = self._stats_cache.get(year)
+        if cached is None:
+            cached = self._stats_cache[year] = self._build_statistics(year)
+        stats, distribution, key_percentiles = cached
+        
+        return {
+            "year": year,
+            "region": "天津市六区",
+            "basic_stats": dict(stats),
+            "score_distribution": [dict(item) for item in distribution],
+            "key_percentiles": dict(key_percentiles),
+            "generated_at": datetime.now().isoformat()
+        }
+    
+    def _build_statistics(self, year: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]:
+        """计算年度的 (基础统计, 分数段分布, 关键百分位)，数据为静态数据，每年只需计算一次"""
         # 基础统计
         stats = self.dao.get_score_statistics(year)
         
@@ -255,14 +401,12 @@ class StatisticsService:
             if score:
                 key_percentiles[f"p{p}"] = score
         
-        return {
-            "year": year,
-            "region": "天津市六区",
-            "basic_stats": stats,
-            "score_distribution": distribution,
-            "key_percentiles": key_percentiles,
-            "generated_at": datetime.now().isoformat()
-        }
+        return stats, distribution, key_percentiles
+    
+    def clear_cache(self):
+        """清空缓存"""
+        self._stats_cache.clear()
+        self._rank_service.clear_cache()
     
     def get_available_years(self) -> List[int]:
         """获取所有可用年份"""
@@ -273,21 +417,21 @@ class StatisticsService:
         if years is None:
             years = self.get_available_years()
         
-        rank_service = RankCalculationService(self.dao)
-        trends = []
-        
-        for year in sorted(years):
-            try:
-                result = rank_service.calculate_rank(score, year)
-                trends.append({
-                    "year": year,
-                    "rank": result.rank,
-                    "percentage": result.percentage,
-                    "total_students": result.total_students
-                })
-            except ValueError:
-                logger.warning(f"无法计算{year}年{score}分的排名")
-                continue
+        try:
+            results = self._rank_service.calculate_ranks_across_years(score, sorted(years))
+        except ValueError as e:
+            logger.warning(f"无法计算{score}分的排名: {e}")
+            results = []
+        
+        trends = [
+            {
+                "year": result.year,
+                "rank": result.rank,
+                "percentage": result.percentage,
+                "total_students": result.total_students
+            }
+            for result in results
+        ]
         
         return {
             "score": score,
@@ -0,0 +1,51 @@
+"""
+API 测试：页面响应的 ETag 条件请求
+"""
+from fastapi.testclient import TestClient
+
+from api import app
+
+
+client = TestClient(app)
+
+
+def _index_etag() -> str:
+    response = client.get("/app")
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+def test_if_none_match_strong_etag_returns_304():
+    """与当前ETag完全相同时返回304"""
+    etag = _index_etag()
+    response = client.get("/app", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_if_none_match_weak_etag_returns_304():
+    """If-None-Match 使用弱比较，W/ 前缀的ETag同样命中"""
+    etag = _index_etag()
+    response = client.get("/app", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+
+
+def test_if_none_match_wildcard_returns_304():
+    """If-None-Match: * 匹配任意ETag"""
+    response = client.get("/app", headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+
+
+def test_if_none_match_other_etag_returns_200():
+    """ETag不同时返回完整页面"""
+    response = client.get("/app", headers={"If-None-Match": 'W/"other"'})
+    assert response.status_code == 200
+    assert response.content
+
+
+def test_rank_rejects_more_than_two_decimals_with_422():
+    """/rank 对超过两位小数的分数返回422，错误信息保持不变"""
+    response = client.post("/rank", json={"score": 650.555})
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "score"]
+    assert error["msg"] == "Value error, 分数仅支持保留两位小数（如750.25、750.50）"
@@ -0,0 +1,15 @@
+"""
+配置测试：分数校验规则
+"""
+from config import validate_score
+
+
+def test_validate_score_accepts_two_decimal_scores():
+    """保留两位小数的分数合法（包括直接比较 score * 100 会因浮点误差误判的分数）"""
+    assert validate_score(650.07)
+    assert validate_score(750.25)
+
+
+def test_validate_score_rejects_more_than_two_decimals():
+    """超过两位小数的分数不合法"""
+    assert not validate_score(650.555)
@@ -0,0 +1,145 @@
+"""
+请求日志测试：JSONL 追加写入、旧版日志迁移、重启后载入
+"""
+import time
+
+import orjson
+
+from request_logger import MAX_RECENT_REQUESTS, RequestLogger
+
+
+def _make_logger(tmp_path) -> RequestLogger:
+    """创建读写 tmp_path 下文件的日志记录器"""
+    return RequestLogger(
+        log_file=str(tmp_path / "api_requests.jsonl"),
+        key_stats_file=str(tmp_path / "key_stats.json"),
+        legacy_log_file=str(tmp_path / "api_requests.json")
+    )
+
+
+def _log(logger: RequestLogger, endpoint: str, api_key, is_valid_key: bool,
+         status_code: int = 200, timestamp: float = None):
+    logger.log_request(
+        endpoint=endpoint,
+        api_key=api_key,
+        is_valid_key=is_valid_key,
+        status_code=status_code,
+        response_time=0.01,
+        client_ip="127.0.0.1",
+        user_agent="pytest",
+        request_data={"score": 700},
+        timestamp=timestamp
+    )
+
+
+def _read_lines(path) -> list:
+    with open(path, "rb") as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+def test_log_requests_written_as_jsonl_and_counted(tmp_path):
+    """记录的请求追加写入 JSONL，统计中的总数、端点计数和24小时请求数正确"""
+    now = time.time()
+    logger = _make_logger(tmp_path)
+    # 记录按时间顺序到达，第一条在24小时之前
+    _log(logger, "/rank", "sk-test-key-0123456789", True, timestamp=now - 2 * 86400)
+    _log(logger, "/rank", "sk-test-key-0123456789", True, timestamp=now - 60)
+    _log(logger, "/recommend", None, False, status_code=401, timestamp=now)
+    logger.close()
+
+    lines = _read_lines(tmp_path / "api_requests.jsonl")
+    assert [line["endpoint"] for line in lines] == ["/rank", "/rank", "/recommend"]
+    assert [line["ts"] for line in lines] == [now - 2 * 86400, now - 60, now]
+    # 日志中只保留密钥前缀
+    assert lines[0]["api_key"] == "sk-test-ke..."
+    assert (tmp_path / "key_stats.json").exists()
+
+    stats = logger.get_stats()
+    summary = stats["summary"]
+    assert summary["total_requests"] == 3
+    assert summary["valid_key_requests"] == 2
+    assert summary["invalid_key_requests"] == 1
+    assert summary["unique_api_keys"] == 1
+    assert summary["requests_24h"] == 2
+    assert stats["endpoint_stats"] == {"/rank": 2, "/recommend": 1}
+
+    key_stats = stats["key_stats"]["sk-test-ke..."]
+    assert key_stats["total_requests"] == 2
+    assert key_stats["successful_requests"] == 2
+    assert key_stats["endpoints"] == {"/rank": 2}
+
+
+def test_legacy_json_log_is_migrated(tmp_path):
+    """旧版整文件 JSON 日志（ISO 时间字符串）迁移为 JSONL，统计输出仍为 ISO 时间"""
+    legacy = {
+        "requests": [
+            {
+                "timestamp": "2024-07-01T10:00:00",
+                "endpoint": "/rank",
+                "api_key": "sk-legacy-...",
+                "is_valid_key": True,
+                "status_code": 200,
+                "response_time_ms": 12.5,
+                "client_ip": "127.0.0.1",
+                "user_agent": "pytest",
+                "request_data": {"score": 700},
+                "error": None
+            }
+        ],
+        "key_stats": {
+            "sk-legacy-...": {
+                "first_seen": "2024-07-01T09:00:00",
+                "last_seen": "2024-07-01T10:00:00",
+                "total_requests": 1,
+                "successful_requests": 1,
+                "failed_requests": 0,
+                "endpoints": {"/rank": 1}
+            },
+            # 旧版统计中可能缺少 last_seen
+            "sk-nolast-...": {
+                "first_seen": "2024-06-30T08:00:00",
+                "total_requests": 0,
+                "successful_requests": 0,
+                "failed_requests": 0,
+                "endpoints": {}
+            }
+        }
+    }
+    (tmp_path / "api_requests.json").write_bytes(orjson.dumps(legacy))
+
+    logger = _make_logger(tmp_path)
+    logger.close()
+
+    lines = _read_lines(tmp_path / "api_requests.jsonl")
+    assert len(lines) == 1
+    assert "timestamp" not in lines[0]
+    assert isinstance(lines[0]["ts"], float)
+
+    stats = logger.get_stats()
+    assert stats["summary"]["total_requests"] == 1
+    assert stats["summary"]["avg_response_time_ms"] == 12.5
+    assert stats["recent_requests"][0]["timestamp"] == "2024-07-01T10:00:00"
+    assert stats["key_stats"]["sk-legacy-..."]["first_seen"] == "2024-07-01T09:00:00"
+    assert stats["key_stats"]["sk-legacy-..."]["last_seen"] == "2024-07-01T10:00:00"
+    assert stats["key_stats"]["sk-nolast-..."]["first_seen"] == "2024-06-30T08:00:00"
+    assert "last_seen" not in stats["key_stats"]["sk-nolast-..."]
+
+
+def test_restart_keeps_at_most_max_recent_requests(tmp_path):
+    """重启后只载入最近 MAX_RECENT_REQUESTS 条请求"""
+    start = time.time() - 3600
+    total = MAX_RECENT_REQUESTS + 50
+    logger = _make_logger(tmp_path)
+    for i in range(total):
+        _log(logger, "/rank", None, False, timestamp=start + i)
+    logger.close()
+
+    restarted = _make_logger(tmp_path)
+    try:
+        stats = restarted.get_stats()
+        assert stats["summary"]["total_requests"] == MAX_RECENT_REQUESTS
+        assert stats["summary"]["requests_24h"] == MAX_RECENT_REQUESTS
+        assert stats["endpoint_stats"] == {"/rank": MAX_RECENT_REQUESTS}
+        assert len(stats["recent_requests"]) == 50
+    finally:
+        restarted.close()
@@ -24,10 +24,15 @@ if [ -f "/app/backend/scores.db" ]; then
     file /app/backend/scores.db
     
     echo "📋 数据库内容检查:"
-    sqlite3 /app/backend/scores.db "SELECT COUNT(*) as '总记录数' FROM score_records;"
-    sqlite3 /app/backend/scores.db "SELECT DISTINCT year as '年份' FROM score_records ORDER BY year;"
-    sqlite3 /app/backend/scores.db "SELECT COUNT(*) as '2024年记录数' FROM score_records WHERE year = 2024;"
-    sqlite3 /app/backend/scores.db "SELECT MIN(score) as '最低分', MAX(score) as '最高分' FROM score_records WHERE year = 2024;"
+    # 只读 + immutable 打开：数据库运行时不会被写入，跳过文件锁和日志检查
+    DB_URI="file:/app/backend/scores.db?mode=ro&immutable=1"
+    # 所有查询在同一个 sqlite3 会话中执行，只打开一次数据库
+    sqlite3 "$DB_URI" <<'SQL'
+SELECT COUNT(*) as '总记录数' FROM score_records;
+SELECT DISTINCT year as '年份' FROM score_records ORDER BY year;
+SELECT COUNT(*) as '2024年记录数' FROM score_records WHERE year = 2024;
+SELECT MIN(score) as '最低分', MAX(score) as '最高分' FROM score_records WHERE year = 2024;
+SQL
 else
     echo "❌ 数据库文件不存在: /app/backend/scores.db"
     echo "🔍 搜索数据库文件:"
@@ -15,7 +15,8 @@ if ! command -v docker &> /dev/null; then
 fi
 
 # 检查是否已有运行的容器
-if docker ps -a --format "table {{.Names}}" | grep -q "^${CONTAINER_NAME}$"; then
+# 由 docker 按名称精确过滤，只输出容器ID，不再解析表格输出
+if [ -n "$(docker ps -aq --filter "name=^${CONTAINER_NAME}$")" ]; then
     echo "📋 发现已存在的容器，正在停止和删除..."
     docker stop $CONTAINER_NAME
     docker rm $CONTAINER_NAME
@@ -39,9 +39,9 @@ else
         if [ "$HTTP_STATUS" = "200" ]; then
             echo "✅ API响应: 正常 (HTTP $HTTP_STATUS)"
             
-            # 获取API信息
-            API_INFO=$(curl -s "$API_URL/" --connect-timeout 5 --max-time 10 2>/dev/null)
-            if [ $? -eq 0 ] && [ -n "$API_INFO" ]; then
+            # 获取API信息（健康检查通过后才请求；响应体直接丢弃，只看返回的字节数）
+            API_INFO_SIZE=$(curl -s -o /dev/null -w "%{size_download}" "$API_URL/" --connect-timeout 5 --max-time 10 2>/dev/null)
+            if [ $? -eq 0 ] && [ "${API_INFO_SIZE:-0}" -gt 0 ]; then
                 echo "📊 API信息: 可访问"
             fi
         elif [ "$HTTP_STATUS" = "000" ]; then